@@ -1,13 +1,29 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, simpledialog
+from tkinter import ttk, messagebox
 import ttkbootstrap as ttkb  # Import ttkbootstrap with alias to differentiate
-from ttkbootstrap import Style
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 import json
 import os
-import csv
+import sys
 import logging
+import logging.handlers
 import calendar
+import queue
+import threading
+from types import SimpleNamespace
+from functools import lru_cache
+from operator import itemgetter
+from bisect import bisect_left, bisect_right, insort
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: stream large record files instead of reading them whole
+except ImportError:
+    ijson = None
 
 # ============================
 # Configuration and Constants
@@ -15,28 +31,172 @@ import calendar
 
 DATA_FILE = "dtr_records.json"
 LOG_FILE = "dtr_app.log"
-
-# Conversion dictionaries based on provided tables
-MINUTES_TO_DAY = {
-    0: 0.0, 1: 0.002, 2: 0.004, 3: 0.006, 4: 0.008, 5: 0.010,
-    6: 0.012, 7: 0.015, 8: 0.017, 9: 0.019, 10: 0.021,
-    11: 0.023, 12: 0.025, 13: 0.027, 14: 0.029, 15: 0.031,
-    16: 0.033, 17: 0.035, 18: 0.037, 19: 0.040, 20: 0.042,
-    21: 0.044, 22: 0.046, 23: 0.048, 24: 0.050, 25: 0.052,
-    26: 0.054, 27: 0.056, 28: 0.058, 29: 0.060, 30: 0.062,
-    31: 0.065, 32: 0.067, 33: 0.069, 34: 0.071, 35: 0.073,
-    36: 0.075, 37: 0.077, 38: 0.079, 39: 0.081, 40: 0.083,
-    41: 0.085, 42: 0.087, 43: 0.090, 44: 0.092, 45: 0.094,
-    46: 0.096, 47: 0.098, 48: 0.100, 49: 0.102, 50: 0.104,
-    51: 0.106, 52: 0.108, 53: 0.110, 54: 0.112, 55: 0.115,
-    56: 0.117, 57: 0.119, 58: 0.121, 59: 0.123, 60: 0.125
+JSON_IO_BUFFER = 1 << 16  # 64 KiB buffer for reading/writing the records file
+TOOLTIP_DELAY = 500  # ms the pointer must rest on a widget before its tooltip shows
+HISTORY_REFRESH_DELAY = 150  # ms to wait for further date changes before refreshing history
+SAVE_ERROR_POLL_INTERVAL = 250  # ms between checks for failed background saves
+
+# Conversion tables based on provided tables, indexed by minutes (0..60)
+# and hours (0..8)
+MINUTES_TO_DAY = (
+    0.0, 0.002, 0.004, 0.006, 0.008, 0.010,
+    0.012, 0.015, 0.017, 0.019, 0.021,
+    0.023, 0.025, 0.027, 0.029, 0.031,
+    0.033, 0.035, 0.037, 0.040, 0.042,
+    0.044, 0.046, 0.048, 0.050, 0.052,
+    0.054, 0.056, 0.058, 0.060, 0.062,
+    0.065, 0.067, 0.069, 0.071, 0.073,
+    0.075, 0.077, 0.079, 0.081, 0.083,
+    0.085, 0.087, 0.090, 0.092, 0.094,
+    0.096, 0.098, 0.100, 0.102, 0.104,
+    0.106, 0.108, 0.110, 0.112, 0.115,
+    0.117, 0.119, 0.121, 0.123, 0.125
+)
+
+HOURS_TO_DAY = (
+    0.0, 0.125, 0.250, 0.375, 0.500,
+    0.625, 0.750, 0.875, 1.000
+)
+
+# Record fields in display/export order, with matching column titles
+RECORD_FIELDS = (
+    "date",
+    "morning_actual_time_in",
+    "supposed_time_in",
+    "late_minutes",
+    "afternoon_actual_time_out",
+    "supposed_time_out",
+    "undertime_minutes",
+    "deduction_points"
+)
+HISTORY_COLUMNS = (
+    "Date",
+    "Morning Actual Time In",
+    "Supposed Time In",
+    "Late Minutes",
+    "Afternoon Actual Time Out",
+    "Supposed Time Out",
+    "Undertime Minutes",
+    "Deduction Points"
+)
+
+# Builds a record's row tuple in RECORD_FIELDS order
+record_values = itemgetter(*RECORD_FIELDS)
+
+# Sort key per history column; dates use the parsed date cached on each record
+HISTORY_SORT_KEYS = {
+    # Records whose stored date can't be parsed sort as the earliest date
+    "Date": lambda x: x["_date_obj"] or date.min,
+    "Morning Actual Time In": itemgetter("morning_actual_time_in"),
+    "Supposed Time In": itemgetter("supposed_time_in"),
+    "Late Minutes": lambda x: float(x["late_minutes"]),
+    "Afternoon Actual Time Out": itemgetter("afternoon_actual_time_out"),
+    "Supposed Time Out": itemgetter("supposed_time_out"),
+    "Undertime Minutes": lambda x: float(x["undertime_minutes"]),
+    "Deduction Points": lambda x: float(x["deduction_points"])
 }
 
-HOURS_TO_DAY = {
-    1: 0.125, 2: 0.250, 3: 0.375, 4: 0.500,
-    5: 0.625, 6: 0.750, 7: 0.875, 8: 1.000
+# Combobox value lists, built once and shared by every combobox/dialog
+HOUR_VALUES = tuple(f"{h:02d}" for h in range(1, 13))        # 01..12
+MINUTE_VALUES = tuple(f"{m:02d}" for m in range(0, 60))      # 00..59
+AMPM_VALUES = ("AM", "PM")
+YEAR_VALUES = tuple(str(year) for year in range(1900, 2126))  # 1900-2125
+MONTH_NAMES = tuple(calendar.month_name[i] for i in range(1, 13))
+# Month name -> number; look up with .get(name, 0) so an unknown name still
+# fails date construction with a ValueError
+MONTH_NUMBERS = {name: number for number, name in enumerate(MONTH_NAMES, 1)}
+DAY_VALUES = tuple(str(day) for day in range(1, 32))
+
+# Themes that get the dark custom styling
+DARK_THEMES = frozenset({"superhero", "darkly"})
+
+# Colors for the custom Apple Calculator-like styling. "light" is used for
+# flatly; dark themes use their own entry or fall back to "dark".
+STYLE_PALETTES = {
+    "light": {
+        "bg": "#FFFFFF", "frame": "#F2F2F2", "text": "#000000",
+        "button": "#D0D0D0", "button_hover": "#C0C0C0",
+        "primary": "#FF9500", "primary_hover": "#FFB340",
+        "field": "#FFFFFF", "menu_fg": "#000000", "option_fg": "black",
+        "button_active_fg": None, "primary_active_fg": None
+    },
+    "superhero": {
+        "bg": "#2E2E2E", "frame": "#3C3C3C", "text": "#FFFFFF",
+        "button": "#505050", "button_hover": "#626262",
+        "primary": "#FF9500", "primary_hover": "#FFA040",
+        "field": "#3C3C3C", "menu_fg": "white", "option_fg": "white",
+        "button_active_fg": "#FFFFFF", "primary_active_fg": "#FFFFFF"
+    },
+    "darkly": {
+        "bg": "#343A40", "frame": "#495057", "text": "#FFFFFF",
+        "button": "#6C757D", "button_hover": "#5A6268",
+        "primary": "#FFC107", "primary_hover": "#FFCA2C",
+        "field": "#495057", "menu_fg": "white", "option_fg": "white",
+        "button_active_fg": "#FFFFFF", "primary_active_fg": "#FFFFFF"
+    },
+    "dark": {
+        "bg": "#333333", "frame": "#444444", "text": "#FFFFFF",
+        "button": "#555555", "button_hover": "#666666",
+        "primary": "#FF9500", "primary_hover": "#FFA040",
+        "field": "#444444", "menu_fg": "white", "option_fg": "white",
+        "button_active_fg": "#FFFFFF", "primary_active_fg": "#FFFFFF"
+    }
 }
 
+
+@lru_cache(maxsize=None)
+def get_style_spec(palette_name):
+    """
+    Build (method, style name, options) entries for a palette once; repeated
+    theme switches reuse the cached tuple.
+    """
+    p = STYLE_PALETTES.get(palette_name, STYLE_PALETTES["dark"])
+
+    button_map = {"background": [("active", p["button_hover"]), ("pressed", p["button_hover"])]}
+    if p["button_active_fg"]:
+        button_map["foreground"] = [("active", p["button_active_fg"])]
+    primary_map = {"background": [("active", p["primary_hover"]), ("pressed", p["primary_hover"])]}
+    if p["primary_active_fg"]:
+        primary_map["foreground"] = [("active", p["primary_active_fg"])]
+
+    return (
+        ("configure", "TFrame", {"background": p["bg"]}),
+        ("configure", "TLabelFrame", {"background": p["frame"], "foreground": p["text"]}),
+        ("configure", "TLabelframe.Label", {"background": p["frame"], "foreground": p["text"]}),
+        ("configure", "TLabel", {"background": p["bg"], "foreground": p["text"]}),
+        ("configure", "Help.TLabel", {"background": p["bg"], "foreground": p["text"], "font": ("Helvetica", 12)}),
+        # Buttons
+        ("configure", "Calc.TButton", {
+            "background": p["button"], "foreground": p["text"], "bordercolor": p["button"],
+            "focusthickness": 0, "relief": "flat", "font": ("Helvetica", 10)
+        }),
+        ("map", "Calc.TButton", button_map),
+        ("configure", "CalcPrimary.TButton", {
+            "background": p["primary"], "foreground": "#FFFFFF", "bordercolor": p["primary"],
+            "focusthickness": 0, "relief": "flat", "font": ("Helvetica", 10)
+        }),
+        ("map", "CalcPrimary.TButton", primary_map),
+        # Checkbutton, Combobox
+        ("configure", "TCheckbutton", {"background": p["bg"], "foreground": p["text"]}),
+        ("configure", "TCombobox", {"fieldbackground": p["field"], "foreground": p["text"]}),
+        ("map", "TCombobox", {
+            "fieldbackground": [("readonly", p["field"])],
+            "selectforeground": [("readonly", p["text"])],
+            "selectbackground": [("readonly", p["field"])]
+        }),
+        # Treeview
+        ("configure", "Treeview", {
+            "background": p["bg"], "fieldbackground": p["bg"], "foreground": p["text"], "rowheight": 25
+        }),
+        ("configure", "Treeview.Heading", {"background": p["frame"], "foreground": p["text"]}),
+        ("configure", "Vertical.TScrollbar", {"background": p["frame"]}),
+        ("configure", "TEntry", {"foreground": p["text"], "fieldbackground": p["field"]}),
+    )
+
+
+# Half-day absence deduction indexed by (morning_checked << 1) | afternoon_checked
+HALF_DAY_DEDUCTIONS = (1.0, 0.5, 0.5, 0.0)
+
 ALLOWED_TIMES = {
     "Monday": {
         "supposed_time_in": time(8, 0)   # 8:00 AM for Monday
@@ -55,44 +215,355 @@ ALLOWED_TIMES = {
     }
 }
 
+# Day names indexed by date.weekday() (Monday == 0)
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# ALLOWED_TIMES supposed time in, indexed by date.weekday();
+# None for days without a schedule
+SUPPOSED_TIME_IN = tuple(
+    ALLOWED_TIMES.get(day, {}).get("supposed_time_in")
+    for day in WEEKDAY_NAMES
+)
+
+# The same times pre-formatted for labels and records
+SUPPOSED_TIME_IN_TEXT = tuple(
+    st.strftime("%I:%M %p") if st else "--:-- --"
+    for st in SUPPOSED_TIME_IN
+)
+
+# Latest flexi supposed time out in minutes after midnight, indexed by
+# date.weekday(): 5:00 PM on Monday, 5:30 PM on other days
+FLEXI_LATEST_TIME_OUT = tuple(1020 if weekday == 0 else 1050 for weekday in range(7))
+
+# Supposed time out when only the afternoon is worked, indexed by
+# date.weekday(): Monday 5:00 PM, other days 5:30 PM
+AFTERNOON_ONLY_TIME_OUT = tuple(time(17, 0 if weekday == 0 else 30) for weekday in range(7))
+AFTERNOON_ONLY_TIME_OUT_TEXT = tuple(t.strftime("%I:%M %p") for t in AFTERNOON_ONLY_TIME_OUT)
+
+# Static help/about dialog content
+HELP_OVERVIEW_TEXT = """Daily Time Record (DTR) Application - Overview
+
+This version includes:
+- Half-Day checking
+- Flexi Time Out logic
+- Multi-selection for deletion
+- Single-record editing
+- Column sorting on click
+- Press 'Delete' key to remove selected row(s)
+- Press 'Ctrl + A' to select all records
+- Time Picker dialogs
+- Light/Dark theme toggle
+- Fullscreen toggle
+- Keyboard shortcuts for changing the selected date:
+   * Ctrl + Right Arrow  => Next Day
+   * Ctrl + Left Arrow   => Previous Day
+   * Ctrl + Shift + Right Arrow => Next Month
+   * Ctrl + Shift + Left Arrow  => Previous Month
+   * Ctrl + Shift + Alt + Right Arrow => Next Year
+   * Ctrl + Shift + Alt + Left Arrow  => Previous Year
+"""
+
+HELP_GUIDE_TEXT = """Step-by-Step Guide
+
+1. Select the Date (top-left) or use keyboard shortcuts (Ctrl/Shift/Alt + Arrow) to navigate quickly.
+2. Check 'Morning' if you worked in the morning; uncheck if absent.
+3. Check 'Afternoon' if you worked in the afternoon; uncheck if absent.
+4. Enter Actual Time In / Out or click 'Select Time'.
+5. Click 'Calculate Deductions' to see Late/Undertime/Total points.
+6. Click 'Save Record' to store it (multiple records per date allowed if you confirm).
+7. Click 'Export History' => CSV to export all saved data.
+8. In the History section:
+   - The default view shows only the currently selected date's records.
+   - Use the date range filter to see multiple dates, then press 'Search'.
+   - 'Reset' reverts back to showing only the currently selected date's records.
+   - You can multi-select rows with Ctrl+Click or Shift+Click,
+     then press 'Delete' key or right-click => 'Delete Record'.
+   - Right-click => 'Edit Record' modifies times and automatically recalculates
+   - Press 'Ctrl + A' to select all records.
+   - Click column headers to toggle ascending/descending sort.
+   - Single/Double-click the time fields to highlight them for quick editing.
+"""
+
+HELP_FAQS_TEXT = """Frequently Asked Questions (FAQs)
+
+Q: Why does the Deduction History only show the selected date by default?
+A: This design helps focus on the current day's data. You can still use date range filters to see more dates.
+
+Q: How do I quickly jump to next/previous days, months, or years?
+A: Use the keyboard shortcuts:
+   * Ctrl + Right/Left => Next/Previous Day
+   * Ctrl + Shift + Right/Left => Next/Previous Month
+   * Ctrl + Shift + Alt + Right/Left => Next/Previous Year
+
+Q: How do I reset the search?
+A: Click the 'Reset' button. This will revert the table to showing only the currently selected date's records.
+
+Q: What if I forget to check Morning or Afternoon?
+A: The system assumes half-day absence for any unchecked portion, adding 0.5 to the deduction.
+
+Q: Can I add multiple records for the same date?
+A: Yes, you'll be prompted with a confirmation if a record already exists for that date.
+
+Q: How do I edit or delete a record?
+A: Right-click on a record in the Deduction History or select it and press 'Delete'. You can also choose 'Edit Record' to modify times.
+
+Q: How does sorting work?
+A: Click the column header to sort ascending/descending for that column. Repeat click to toggle the order.
+
+Q: Does the application remember my data after closing?
+A: Yes, data is stored in JSON (dtr_records.json). Keep it safe to avoid losing records.
+
+Q: Can I see all records at once?
+A: Enter a broad date range in the search fields (e.g., 1900 to 2125) and click 'Search' to see all.
+
+Q: What if I want to revert to seeing only the selected date after searching?
+A: Simply click 'Reset' or change the date manually (which also forces single-date mode again).
+"""
+
+ABOUT_TEXT = """Daily Time Record (DTR) Application
+
+Enhanced with:
+ - Half-Day Checking
+ - Flexi Time Out
+ - Multi-selection & Sorting
+ - Simplified Record Editing
+ - Time Picker for convenience
+ - Light/Dark Mode toggle
+ - Fullscreen toggle
+ - Keyboard Shortcuts for Date Navigation
+
+Developer: KCprsnlcc
+GitHub: https://github.com/KCprsnlcc
+
+Disclaimer: Use at your own risk. Keep data backups.
+"""
+
+
+# Rounded day fraction for every (hours 0..8, minutes 0..60) pair,
+# flattened so that DAY_FRACTIONS[hours * 61 + minutes] is the result.
+DAY_FRACTIONS = tuple(
+    round(HOURS_TO_DAY[h] + MINUTES_TO_DAY[m], 3)
+    for h in range(9) for m in range(61)
+)
+
+
 def convert_time_diff_to_day_fraction(hours, minutes):
     """
     Convert hours/minutes difference into a fraction of a day (up to 8 hours).
     """
-    hours = max(0, min(hours, 8))
-    minutes = max(0, min(minutes, 60))
-    day_fraction = HOURS_TO_DAY.get(hours, 0.0) + MINUTES_TO_DAY.get(minutes, 0.0)
-    return round(day_fraction, 3)
+    hours = 0 if hours < 0 else 8 if hours > 8 else hours
+    minutes = 0 if minutes < 0 else 60 if minutes > 60 else minutes
+    return DAY_FRACTIONS[hours * 61 + minutes]
+
+
+def convert_minutes_to_day_fraction(total_minutes):
+    """
+    Convert a total number of minutes into a fraction of a day (up to 8 hours).
+    The conversion tables are not linear, so this still goes through them
+    rather than dividing by 480.
+    """
+    if total_minutes <= 0:
+        return 0.0
+    return convert_time_diff_to_day_fraction(*divmod(total_minutes, 60))
+
+
+def flexi_time_out(time_in, weekday):
+    """
+    Supposed time out for a full (flexi) day: nine hours after the time in,
+    with the time in clamped to 7:30-8:30 AM and the time out to
+    4:30 PM-FLEXI_LATEST_TIME_OUT.
+    """
+    in_minutes = min(max(time_in.hour * 60 + time_in.minute, 450), 510)
+    out_minutes = min(max(in_minutes + 540, 990), FLEXI_LATEST_TIME_OUT[weekday])
+    return time(out_minutes // 60, out_minutes % 60)
+
+
+def parse_time_12h(time_str):
+    """
+    Parse an "HH:MM AM/PM" string into a time object, as
+    strptime(time_str, "%I:%M %p") would but without its format machinery.
+    Raises ValueError for invalid input.
+    """
+    clock, _, period = time_str.partition(" ")
+    hour_str, sep, minute_str = clock.partition(":")
+    period = period.lstrip().upper()
+    if (not sep or period not in ("AM", "PM")
+            or not 0 < len(hour_str) <= 2 or not 0 < len(minute_str) <= 2
+            or not (hour_str.isascii() and hour_str.isdigit())
+            or not (minute_str.isascii() and minute_str.isdigit())):
+        raise ValueError(f"time data {time_str!r} does not match format '%I:%M %p'")
+    hour = int(hour_str)
+    minute = int(minute_str)
+    if not 1 <= hour <= 12 or minute > 59:
+        raise ValueError(f"time data {time_str!r} does not match format '%I:%M %p'")
+    hour %= 12
+    if period == "PM":
+        hour += 12
+    return time(hour, minute)
+
+
+def parse_record_date(date_str):
+    """
+    Parse a record's "YYYY-MM-DD" date string into a date object.
+    Canonical strings are sliced directly; anything else goes through
+    strptime so it accepts and rejects exactly what "%Y-%m-%d" does.
+    """
+    if (len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-"
+            and date_str[0:4].isdigit() and date_str[5:7].isdigit() and date_str[8:10].isdigit()
+            and date_str.isascii()):
+        return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
+def record_date_or_none(value):
+    """
+    Return the parsed date of a record's "date" value, or None when it is
+    missing or not a valid "YYYY-MM-DD" string.
+    """
+    try:
+        return parse_record_date(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def days_in_month(year, month):
+    """
+    Return the number of days in the given month, memoized per (year, month).
+    """
+    return calendar.monthrange(year, month)[1]
+
+
+@lru_cache(maxsize=64)
+def day_values(year, month):
+    """
+    Return the day combobox values ("1".."28/29/30/31") for the given month.
+    """
+    return DAY_VALUES[:days_in_month(year, month)]
+
+
+def read_json_file(path):
+    """
+    Read and parse a JSON file, using orjson when it is installed.
+    """
+    with open(path, 'rb', buffering=JSON_IO_BUFFER) as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_records_file(path):
+    """
+    Read the records file. When ijson is installed and the file holds a
+    JSON list, records are streamed one by one so the raw file never has to
+    sit in memory next to the parsed objects. Otherwise falls back to
+    read_json_file.
+    """
+    if ijson is not None:
+        with open(path, 'rb', buffering=JSON_IO_BUFFER) as f:
+            if f.peek(JSON_IO_BUFFER).lstrip().startswith(b"["):
+                return list(ijson.items(f, "item", use_float=True))
+    return read_json_file(path)
+
+
+def dump_json_bytes(data):
+    """
+    Encode data as compact UTF-8 JSON with a trailing newline, using orjson
+    when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def serialize_records(records):
+    """
+    Return copies of the records without the in-memory helper fields (keys
+    starting with an underscore), ready to be written as JSON.
+    """
+    return [
+        {key: value for key, value in record.items() if not key.startswith("_")}
+        for record in records
+    ]
 
 
 def setup_logging():
     """
     Configure logging for the application.
+    Log records are handed to a queue and written to LOG_FILE by a
+    background listener, so file I/O never blocks the UI thread.
+    Returns the started QueueListener; stop it before exiting.
     """
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    # The queue handler only passes the message on; the file handler
+    # applies the full format when the listener writes it.
     logging.basicConfig(
-        filename=LOG_FILE,
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
 
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    return listener
+
 # ---------------------
 #     Tooltip Class
 # ---------------------
 class Tooltip:
     """
     A custom tooltip class for Tkinter widgets that displays above the cursor.
+    All instances share one tooltip window that is re-labelled and moved on
+    show and withdrawn on hide.
     """
-    def __init__(self, widget, text='widget info'):
+    _tw = None       # shared tooltip Toplevel
+    _label = None    # its Label
+    _owner = None    # Tooltip instance currently showing it
+    _by_widget = {}  # widget path -> Tooltip, for the shared "Tooltip" bindtag
+    _class_bound = False
+
+    def __init__(self, widget, text='widget info', delay=TOOLTIP_DELAY):
         self.widget = widget
         self.text = text
+        self.delay = delay
         self.tipwindow = None
         self.id = None
         self.x = self.y = 0
-        self.widget.bind("<Enter>", self.enter)
-        self.widget.bind("<Leave>", self.leave)
-        self.widget.bind("<Motion>", self.move)
+        if not Tooltip._class_bound:
+            # Bind the handlers once on a shared tag instead of per widget
+            widget.bind_class("Tooltip", "<Enter>", Tooltip._dispatch_enter)
+            widget.bind_class("Tooltip", "<Leave>", Tooltip._dispatch_leave)
+            widget.bind_class("Tooltip", "<Motion>", Tooltip._dispatch_move)
+            Tooltip._class_bound = True
+        Tooltip._by_widget[str(widget)] = self
+        widget.bindtags(widget.bindtags() + ("Tooltip",))
+
+    @staticmethod
+    def _dispatch_enter(event):
+        tip = Tooltip._by_widget.get(str(event.widget))
+        if tip is not None:
+            tip.enter(event)
+
+    @staticmethod
+    def _dispatch_leave(event):
+        tip = Tooltip._by_widget.get(str(event.widget))
+        if tip is not None:
+            tip.leave(event)
+
+    @staticmethod
+    def _dispatch_move(event):
+        tip = Tooltip._by_widget.get(str(event.widget))
+        if tip is not None:
+            tip.move(event)
 
     def enter(self, event=None):
+        if event is not None:
+            self.x = event.x_root
+            self.y = event.y_root
         self.schedule()
 
     def leave(self, event=None):
@@ -105,7 +576,9 @@ class Tooltip:
 
     def schedule(self):
         self.unschedule()
-        self.id = self.widget.after(500, self.showtip)
+        if not self.text:
+            return
+        self.id = self.widget.after(self.delay, self.showtip)
 
     def unschedule(self):
         id_ = self.id
@@ -117,23 +590,34 @@ class Tooltip:
         if self.tipwindow or not self.text:
             return
 
-        # Create the tooltip window
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)  # Remove window decorations
-        tw.wm_geometry(f"+{self.x}+{self.y - 20}")  # Position above the cursor (20 px above)
+        tw = Tooltip._tw
+        if tw is None or not tw.winfo_exists():
+            # Create the shared tooltip window on first use, owned by the root
+            tw = tk.Toplevel(self.widget.nametowidget("."))
+            tw.wm_overrideredirect(True)  # Remove window decorations
+
+            # Add the label with the tooltip text
+            Tooltip._label = ttk.Label(
+                tw, justify=tk.LEFT,
+                background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                font=("tahoma", "8", "normal"),
+                foreground="#000000"  # Set font color explicitly to black
+            )
+            Tooltip._label.pack(ipadx=1)
+            Tooltip._tw = tw
 
-        # Add the label with the tooltip text
-        label = ttk.Label(
-            tw, text=self.text, justify=tk.LEFT,
-            background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-            font=("tahoma", "8", "normal"),
-            foreground="#000000"  # Set font color explicitly to black
-        )
-        label.pack(ipadx=1)
+        Tooltip._label.config(text=self.text)
+        tw.wm_geometry(f"+{self.x}+{self.y - 20}")  # Position above the cursor (20 px above)
+        tw.deiconify()
+        tw.lift()
+        Tooltip._owner = self
+        self.tipwindow = tw
 
     def hidetip(self):
-        if self.tipwindow:
-            self.tipwindow.destroy()
+        # Only hide the shared window if this tooltip is the one showing it
+        if self.tipwindow and Tooltip._owner is self:
+            self.tipwindow.withdraw()
+            Tooltip._owner = None
         self.tipwindow = None
 
 
@@ -144,39 +628,28 @@ class TimePickerDialog:
     """
     A dialog for selecting time (Hour, Minute, AM/PM) with dropdowns (Combobox).
     Removed overrideredirect so the OS window decorations (including X) are shown.
+    Closing only hides the dialog; call reset() to show it again for a new time.
     """
-    def __init__(self, parent, initial_time=None, title="Select Time"):
+    def __init__(self, parent, initial_time=None, title="Select Time", app=None):
         self.parent = parent
+        # DailyTimeRecordApp whose cached main-window geometry centers us over its master
+        self.app = app
         self.top = tk.Toplevel(parent)
-        self.top.title(title)
-
-        # Make the dialog modal-like
-        self.top.grab_set()
 
         # Keep it on top in fullscreen mode
         self.top.transient(self.parent)
-        self.top.lift()
 
         self.selected_time = None
-
-        if initial_time:
-            hour_24 = initial_time.hour
-            minute = initial_time.minute
-            ampm = "PM" if hour_24 >= 12 else "AM"
-            hour = hour_24 % 12
-            hour = 12 if hour == 0 else hour
-        else:
-            hour = 12
-            minute = 0
-            ampm = "AM"
+        # Set when the dialog is closed, ending the wait in show()
+        self._closed = tk.BooleanVar(self.top, value=False)
 
         # Hour
         ttk.Label(self.top, text="Hour:").grid(row=0, column=0, padx=10, pady=5, sticky="e")
-        self.hour_var = tk.StringVar(value=str(hour).zfill(2))
+        self.hour_var = tk.StringVar()
         self.hour_combo = ttk.Combobox(
             self.top,
             textvariable=self.hour_var,
-            values=[f"{h:02d}" for h in range(1, 13)],  # 01..12
+            values=HOUR_VALUES,
             state="readonly",
             width=5
         )
@@ -184,11 +657,11 @@ class TimePickerDialog:
 
         # Minute
         ttk.Label(self.top, text="Minute:").grid(row=1, column=0, padx=10, pady=5, sticky="e")
-        self.minute_var = tk.StringVar(value=f"{minute:02}")
+        self.minute_var = tk.StringVar()
         self.minute_combo = ttk.Combobox(
             self.top,
             textvariable=self.minute_var,
-            values=[f"{m:02d}" for m in range(0, 60)],  # 00..59
+            values=MINUTE_VALUES,
             state="readonly",
             width=5
         )
@@ -196,16 +669,15 @@ class TimePickerDialog:
 
         # AM/PM
         ttk.Label(self.top, text="AM/PM:").grid(row=2, column=0, padx=10, pady=5, sticky="e")
-        self.ampm_var = tk.StringVar(value=ampm)
+        self.ampm_var = tk.StringVar()
         self.ampm_combo = ttk.Combobox(
             self.top,
             textvariable=self.ampm_var,
-            values=["AM", "PM"],
+            values=AMPM_VALUES,
             state="readonly",
             width=3
         )
         self.ampm_combo.grid(row=2, column=1, padx=10, pady=5, sticky="w")
-        self.ampm_combo.current(0 if ampm == "AM" else 1)
 
         # Buttons
         button_frame = ttk.Frame(self.top)
@@ -214,20 +686,56 @@ class TimePickerDialog:
         ttk.Button(button_frame, text="OK", command=self.on_ok).pack(side="left", padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.on_cancel).pack(side="left", padx=5)
 
-        self.center_dialog()
         self.top.protocol("WM_DELETE_WINDOW", self.on_cancel)
+        self.reset(initial_time, title)
+
+    def reset(self, initial_time=None, title="Select Time"):
+        """
+        Load a new initial time and title, then show the dialog modally.
+        """
+        if initial_time:
+            hour_24 = initial_time.hour
+            minute = initial_time.minute
+            ampm = "PM" if hour_24 >= 12 else "AM"
+            hour = hour_24 % 12
+            hour = 12 if hour == 0 else hour
+        else:
+            hour = 12
+            minute = 0
+            ampm = "AM"
+
+        self.top.title(title)
+        self.hour_var.set(str(hour).zfill(2))
+        self.minute_var.set(f"{minute:02}")
+        self.ampm_combo.current(0 if ampm == "AM" else 1)
+        self.selected_time = None
+        self._closed.set(False)
+
+        self.top.deiconify()
+        self.center_dialog()
+        self.top.lift()
+        # Make the dialog modal-like
+        self.top.grab_set()
+
+    def close(self):
+        self.top.grab_release()
+        self.top.withdraw()
+        self._closed.set(True)
 
     def center_dialog(self):
         """
         Center the Toplevel over the parent window.
         """
-        self.parent.update_idletasks()
-        parent_x = self.parent.winfo_rootx()
-        parent_y = self.parent.winfo_rooty()
-        parent_width = self.parent.winfo_width()
-        parent_height = self.parent.winfo_height()
-
+        # One idle pass lays out both windows; update_idletasks is app-wide
         self.top.update_idletasks()
+        if self.app is not None and self.parent is self.app.master:
+            parent_x, parent_y, parent_width, parent_height = self.app.get_master_geometry()
+        else:
+            parent_x = self.parent.winfo_rootx()
+            parent_y = self.parent.winfo_rooty()
+            parent_width = self.parent.winfo_width()
+            parent_height = self.parent.winfo_height()
+
         dialog_width = self.top.winfo_width()
         dialog_height = self.top.winfo_height()
 
@@ -248,18 +756,35 @@ class TimePickerDialog:
                 hour = 0
 
             self.selected_time = time(hour, minute)
-            self.top.destroy()
+            self.close()
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid time.", parent=self.top)
 
     def on_cancel(self):
-        self.top.destroy()
+        self.close()
 
     def show(self):
-        self.top.wait_window()
+        if not self._closed.get():
+            self.top.wait_variable(self._closed)
         return self.selected_time
 
 
+def open_time_picker_dialog(owner, parent, initial_time, title, app=None):
+    """
+    Show the TimePickerDialog cached on owner (building it on first use)
+    and return the chosen time, or None if it was cancelled. Pass app when
+    parent is its main window so centering can use the cached geometry.
+    """
+    picker = owner._time_picker
+    if picker is not None and picker.top.winfo_exists():
+        picker.reset(initial_time, title)
+    else:
+        picker = owner._time_picker = TimePickerDialog(
+            parent, initial_time=initial_time, title=title, app=app
+        )
+    return picker.show()
+
+
 # ---------------------------
 #  DailyTimeRecordApp Class
 # ---------------------------
@@ -283,23 +808,72 @@ class DailyTimeRecordApp:
         master.resizable(True, True)
 
         # Initialize ttkbootstrap Style
-        self.style = Style(theme='flatly')
+        self.style = ttkb.Style(theme='flatly')
         self.current_theme = 'flatly'
+        # Plain text color for the current theme ("black" for light mode)
+        self._text_fg = "black"
 
         # Initialize records
         self.records = self.load_records()
+        # date string -> records for that date, kept in sync with self.records,
+        # plus the distinct date strings in sorted order for range lookups
+        self._records_by_date = {}
+        self._sorted_dates = []
+        # Records whose stored date can't be parsed; kept but not indexed
+        self._undated_records = []
+        self.rebuild_records_index()
+
+        # Background writer: holds at most one pending snapshot, so bursts of
+        # saves collapse into a single write of the latest state.
+        self._save_queue = queue.Queue(maxsize=1)
+        # Error messages from the writer thread, shown by the Tk thread since
+        # the writer must not touch Tk
+        self._save_errors = queue.SimpleQueue()
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
         # Holds the *filtered* records for display in the treeview
         self.current_records = []
+        # Treeview item id -> record shown in that row
+        self._tree_records = {}
+
+        # Help/About dialogs are built once, then hidden and re-shown
+        self._help_window = None
+        self._help_texts = []
+        # TimePickerDialog for the time inputs, built on first use
+        self._time_picker = None
+        self._pending_help_tabs = {}
+        self._about_window = None
 
         # By default, we display only for the selected date.
         self.search_active = False  # If a date range search is active, this is True.
 
         self.selected_date = datetime.now().date()
-        self.current_day = self.selected_date.strftime("%A")
+        self.current_day = WEEKDAY_NAMES[self.selected_date.weekday()]
 
         self.morning_check = tk.BooleanVar(value=True)
         self.afternoon_check = tk.BooleanVar(value=True)
 
+        # True while a recalculation is scheduled but not yet run
+        self._recalc_pending = False
+        # after() id of a pending history refresh for the selected date
+        self._history_refresh_id = None
+
+        # attr_name -> namespace of the vars/widgets built by create_actual_time_input
+        self._fields = {}
+        # Tk-side keystroke filter shared by every hour/minute entry
+        self._two_digit_vcmd = (self.master.register(self.is_two_digit_input), '%P')
+
+        # Day combobox path -> day values it currently offers (all start at 31)
+        self._day_values = {}
+
+        # Results of the last calculation, mirrored by the result labels
+        self._last_late_minutes = 0
+        self._last_undertime_minutes = 0
+        self._last_total_deduction = 0.0
+        # Text shown after "Supposed Time In: " / "Supposed Time Out: "
+        self._supposed_time_in_text = "--:-- --"
+        self._supposed_time_out_text = "--:-- --"
+
         # Create the menubar early
         self.menubar = tk.Menu(self.master)
         self.master.config(menu=self.menubar)
@@ -314,7 +888,23 @@ class DailyTimeRecordApp:
         self.setup_controls()
         self.setup_history()
 
+        # Labels whose foreground follows the light/dark theme
+        self._themed_labels = [
+            self.label_morning_late,
+            self.label_morning_late_deduction,
+            self.label_afternoon_undertime,
+            self.label_afternoon_undertime_deduction,
+            self.label_day,
+            self.label_supposed_time_in,
+            self.label_supposed_time_out,
+            self.label_deductions,
+        ]
+
         self.center_window()
+        # Cached main window geometry for centering dialogs
+        self._master_geometry = None
+        self.master.bind("<Configure>", self.on_master_configure, add="+")
+        self.master.after(SAVE_ERROR_POLL_INTERVAL, self.poll_save_errors)
         self.update_supposed_time_in_label()
         self.update_supposed_time_out_label()
 
@@ -371,7 +961,7 @@ class DailyTimeRecordApp:
             new_year += 1
 
         # Clamp the day if it exceeds the number of days in the new month
-        num_days = calendar.monthrange(new_year, new_month)[1]
+        num_days = days_in_month(new_year, new_month)
         new_day = min(day, num_days)
 
         new_date = datetime(new_year, new_month, new_day).date()
@@ -389,7 +979,7 @@ class DailyTimeRecordApp:
             new_year -= 1
 
         # Clamp the day if it exceeds the number of days in the new month
-        num_days = calendar.monthrange(new_year, new_month)[1]
+        num_days = days_in_month(new_year, new_month)
         new_day = min(day, num_days)
 
         new_date = datetime(new_year, new_month, new_day).date()
@@ -402,7 +992,7 @@ class DailyTimeRecordApp:
 
         new_year = year + 1
         # clamp day to new year's month last day if needed
-        num_days = calendar.monthrange(new_year, month)[1]
+        num_days = days_in_month(new_year, month)
         new_day = min(day, num_days)
 
         new_date = datetime(new_year, month, new_day).date()
@@ -415,7 +1005,7 @@ class DailyTimeRecordApp:
 
         new_year = year - 1
         # clamp day
-        num_days = calendar.monthrange(new_year, month)[1]
+        num_days = days_in_month(new_year, month)
         new_day = min(day, num_days)
 
         new_date = datetime(new_year, month, new_day).date()
@@ -427,7 +1017,7 @@ class DailyTimeRecordApp:
         self.search_active = False  # going back to single date display
         # Update combos to reflect new date
         self.year_var.set(str(self.selected_date.year))
-        self.month_var.set(calendar.month_name[self.selected_date.month])
+        self.month_var.set(MONTH_NAMES[self.selected_date.month - 1])
         self.day_var.set(str(self.selected_date.day))
         # This will also call on_date_change, which refreshes everything
         self.on_date_change(None)
@@ -436,11 +1026,26 @@ class DailyTimeRecordApp:
     #   A method to show only the currently selected date's records
     # ---------------------------------------------------------
     def populate_history_for_selected_date(self):
-        date_str = self.selected_date.strftime("%Y-%m-%d")
-        filtered = [r for r in self.records if r["date"] == date_str]
+        date_str = self.selected_date.isoformat()
+        filtered = list(self._records_by_date.get(date_str, ()))
         self.current_records = filtered
         self.populate_history(filtered)
 
+    def schedule_history_refresh(self):
+        """
+        Show the selected date's records after a short delay, so rapid date
+        changes (e.g. holding a date shortcut key) rebuild the tree only once.
+        """
+        if self._history_refresh_id is not None:
+            self.master.after_cancel(self._history_refresh_id)
+        self._history_refresh_id = self.master.after(HISTORY_REFRESH_DELAY, self._refresh_history_now)
+
+    def _refresh_history_now(self):
+        self._history_refresh_id = None
+        # A search started in the meantime takes precedence
+        if not self.search_active:
+            self.populate_history_for_selected_date()
+
     # ---------------------------------------------------------
     #   For "Reset" button => revert to the selected date's data
     # ---------------------------------------------------------
@@ -453,31 +1058,40 @@ class DailyTimeRecordApp:
     #   (If no record list is given, we use self.current_records)
     # ---------------------------------------------------------
     def populate_history(self, records=None):
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
+        # One Tcl call clears the whole tree
+        self.history_tree.delete(*self.history_tree.get_children())
 
         if records is None:
             records = self.current_records
 
+        # Same as insert_history_row, with the lookups hoisted out of the loop
+        tree_records = self._tree_records = {}
+        insert = self.history_tree.insert
         for record in records:
-            self.history_tree.insert("", "end", values=(
-                record["date"],
-                record.get("morning_actual_time_in", "--:-- --"),
-                record.get("supposed_time_in", "--:-- --"),
-                record.get("late_minutes", 0),
-                record.get("afternoon_actual_time_out", "--:-- --"),
-                record.get("supposed_time_out", "--:-- --"),
-                record.get("undertime_minutes", 0),
-                record["deduction_points"]
-            ))
-        logging.info("History populated in Treeview.")
+            iid = str(id(record))
+            tree_records[iid] = record
+            insert("", "end", iid=iid, values=record_values(record))
+        # Runs on every date change, so keep it out of the INFO log
+        logging.debug("History populated in Treeview (%d rows).", len(tree_records))
+
+    def insert_history_row(self, record, index="end"):
+        """
+        Insert a single record into the history Treeview. The item id is
+        derived from the record object so later edits/deletes can address
+        the row directly instead of rebuilding the whole tree.
+        """
+        iid = str(id(record))
+        self._tree_records[iid] = record
+        # Every record has all fields (load_records fills in defaults)
+        self.history_tree.insert("", index, iid=iid, values=record_values(record))
 
     def select_all_records(self):
         """
         Selects all records in the history Treeview.
         """
-        for child in self.history_tree.get_children():
-            self.history_tree.selection_add(child)
+        children = self.history_tree.get_children()
+        if children:
+            self.history_tree.selection_set(children)
 
     # ------------------------------------------------------------------------
     # THEME & STYLE CODE
@@ -486,177 +1100,33 @@ class DailyTimeRecordApp:
         """
         Apple Calculator–inspired LIGHT mode (no menubar recreation).
         """
-        BG_LIGHT = "#FFFFFF"
-        BG_FRAME = "#F2F2F2"
-        FG_TEXT = "#000000"
-        BTN_GRAY = "#D0D0D0"
-        BTN_ORANGE = "#FF9500"
-        BTN_HOVER_GRAY = "#C0C0C0"
-        BTN_HOVER_ORANGE = "#FFB340"
-
-        self.master.configure(bg=BG_LIGHT)
-
-        self.style.configure("TFrame", background=BG_LIGHT)
-        self.style.configure("TLabelFrame", background=BG_FRAME, foreground=FG_TEXT)
-        self.style.configure("TLabelframe.Label", background=BG_FRAME, foreground=FG_TEXT)
-        self.style.configure("TLabel", background=BG_LIGHT, foreground=FG_TEXT)
-
-        # Buttons
-        self.style.configure(
-            "Calc.TButton",
-            background=BTN_GRAY,
-            foreground=FG_TEXT,
-            bordercolor=BTN_GRAY,
-            focusthickness=0,
-            relief="flat",
-            font=("Helvetica", 10)
-        )
-        self.style.map(
-            "Calc.TButton",
-            background=[("active", BTN_HOVER_GRAY), ("pressed", BTN_HOVER_GRAY)]
-        )
-
-        self.style.configure(
-            "CalcPrimary.TButton",
-            background=BTN_ORANGE,
-            foreground="#FFFFFF",
-            bordercolor=BTN_ORANGE,
-            focusthickness=0,
-            relief="flat",
-            font=("Helvetica", 10)
-        )
-        self.style.map(
-            "CalcPrimary.TButton",
-            background=[("active", BTN_HOVER_ORANGE), ("pressed", BTN_HOVER_ORANGE)]
-        )
-
-        # Checkbutton, Combobox
-        self.style.configure("TCheckbutton", background=BG_LIGHT, foreground=FG_TEXT)
-        self.style.configure(
-            "TCombobox",
-            fieldbackground="#FFFFFF",
-            foreground=FG_TEXT
-        )
-        self.style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", "#FFFFFF")],
-            selectforeground=[("readonly", FG_TEXT)],
-            selectbackground=[("readonly", "#FFFFFF")]
-        )
-
-        # Treeview
-        self.style.configure(
-            "Treeview",
-            background="#FFFFFF",
-            fieldbackground="#FFFFFF",
-            foreground=FG_TEXT,
-            rowheight=25
-        )
-        self.style.configure(
-            "Treeview.Heading",
-            background=BG_FRAME,
-            foreground=FG_TEXT
-        )
-
-        self.style.configure("Vertical.TScrollbar", background=BG_FRAME)
-        self.style.configure("TEntry", foreground=FG_TEXT, fieldbackground="#FFFFFF")
-
-        self.menubar.config(bg=BG_LIGHT, fg=FG_TEXT, activebackground=BG_FRAME, activeforeground=FG_TEXT)
-        self.master.option_add("*foreground", "black")
+        self.apply_style_palette("light")
 
     def apply_apple_calculator_dark_style(self):
         """
         Apply custom styles for dark themes ('superhero' or 'darkly').
         """
-        if self.current_theme == "superhero":
-            BG_DARK = "#2E2E2E"
-            BG_FRAME = "#3C3C3C"
-            FG_TEXT = "#FFFFFF"
-            BTN_GRAY = "#505050"
-            BTN_ORANGE = "#FF9500"
-            BTN_HOVER_GRAY = "#626262"
-            BTN_HOVER_ORANGE = "#FFA040"
-        elif self.current_theme == "darkly":
-            BG_DARK = "#343A40"
-            BG_FRAME = "#495057"
-            FG_TEXT = "#FFFFFF"
-            BTN_GRAY = "#6C757D"
-            BTN_ORANGE = "#FFC107"
-            BTN_HOVER_GRAY = "#5A6268"
-            BTN_HOVER_ORANGE = "#FFCA2C"
-        else:
-            BG_DARK = "#333333"
-            BG_FRAME = "#444444"
-            FG_TEXT = "#FFFFFF"
-            BTN_GRAY = "#555555"
-            BTN_ORANGE = "#FF9500"
-            BTN_HOVER_GRAY = "#666666"
-            BTN_HOVER_ORANGE = "#FFA040"
-
-        self.master.configure(bg=BG_DARK)
-        self.style.configure("TFrame", background=BG_DARK)
-        self.style.configure("TLabelFrame", background=BG_FRAME, foreground=FG_TEXT)
-        self.style.configure("TLabelframe.Label", background=BG_FRAME, foreground=FG_TEXT)
-        self.style.configure("TLabel", background=BG_DARK, foreground=FG_TEXT)
-
-        # Buttons
-        self.style.configure(
-            "Calc.TButton",
-            background=BTN_GRAY,
-            foreground=FG_TEXT,
-            bordercolor=BTN_GRAY,
-            focusthickness=0,
-            relief="flat",
-            font=("Helvetica", 10)
-        )
-        self.style.map(
-            "Calc.TButton",
-            background=[("active", BTN_HOVER_GRAY), ("pressed", BTN_HOVER_GRAY)],
-            foreground=[("active", FG_TEXT)]
-        )
-
-        self.style.configure(
-            "CalcPrimary.TButton",
-            background=BTN_ORANGE,
-            foreground="#FFFFFF",
-            bordercolor=BTN_ORANGE,
-            focusthickness=0,
-            relief="flat",
-            font=("Helvetica", 10)
-        )
-        self.style.map(
-            "CalcPrimary.TButton",
-            background=[("active", BTN_HOVER_ORANGE), ("pressed", BTN_HOVER_ORANGE)],
-            foreground=[("active", "#FFFFFF")]
-        )
+        self.apply_style_palette(self.current_theme)
 
-        self.style.configure("TCheckbutton", background=BG_DARK, foreground=FG_TEXT)
-        self.style.configure("TCombobox", fieldbackground=BG_FRAME, foreground=FG_TEXT)
-        self.style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", BG_FRAME)],
-            selectforeground=[("readonly", FG_TEXT)],
-            selectbackground=[("readonly", BG_FRAME)]
-        )
+    def apply_style_palette(self, palette_name):
+        """
+        Apply the ttk styles, menubar colors and window background for one
+        entry of STYLE_PALETTES (unknown names use the generic dark palette).
+        """
+        palette = STYLE_PALETTES.get(palette_name, STYLE_PALETTES["dark"])
 
-        self.style.configure(
-            "Treeview",
-            background=BG_DARK,
-            fieldbackground=BG_DARK,
-            foreground=FG_TEXT,
-            rowheight=25
-        )
-        self.style.configure(
-            "Treeview.Heading",
-            background=BG_FRAME,
-            foreground=FG_TEXT
-        )
+        self.master.configure(bg=palette["bg"])
+        self._themed_bg = palette["bg"]
 
-        self.style.configure("Vertical.TScrollbar", background=BG_FRAME)
-        self.style.configure("TEntry", foreground=FG_TEXT, fieldbackground=BG_FRAME)
+        for method, style_name, options in get_style_spec(palette_name):
+            if method == "map":
+                self.style.map(style_name, **options)
+            else:
+                self.style.configure(style_name, **options)
 
-        self.menubar.config(bg=BG_DARK, fg="white", activebackground=BG_FRAME, activeforeground="white")
-        self.master.option_add("*foreground", "white")
+        self.menubar.config(bg=palette["bg"], fg=palette["menu_fg"],
+                            activebackground=palette["frame"], activeforeground=palette["menu_fg"])
+        self.master.option_add("*foreground", palette["option_fg"])
 
     def update_label_colors(self):
         """
@@ -667,21 +1137,15 @@ class DailyTimeRecordApp:
         else:  # Dark mode
             text_color = "#FFFFFF"
 
-        self.label_morning_late.config(foreground=text_color)
-        self.label_morning_late_deduction.config(foreground=text_color)
-        self.label_afternoon_undertime.config(foreground=text_color)
-        self.label_afternoon_undertime_deduction.config(foreground=text_color)
-        self.label_day.config(foreground=text_color)
-        self.label_supposed_time_in.config(foreground=text_color)
-        self.label_supposed_time_out.config(foreground=text_color)
-        self.label_deductions.config(foreground=text_color)
+        for label in self._themed_labels:
+            label.config(foreground=text_color)
 
     def refresh_all_widget_colors(self):
         """
         Re-apply correct foreground colors to all relevant Entry/Combobox
         after a theme switch, preserving 'red' for invalid input.
         """
-        normal_color = "black" if self.current_theme == 'flatly' else "white"
+        normal_color = self._text_fg
 
         def refresh_entry(widget):
             current_fg = widget.cget("foreground")
@@ -706,6 +1170,7 @@ class DailyTimeRecordApp:
         Switch between 'Light Mode' (flatly) and 'Dark Mode' (superhero or darkly).
         """
         self.current_theme = theme_name
+        self._text_fg = "black" if theme_name == "flatly" else "white"
         try:
             self.style.theme_use(theme_name)
         except tk.TclError:
@@ -715,7 +1180,7 @@ class DailyTimeRecordApp:
 
         if theme_name == "flatly":
             self.apply_apple_calculator_light_style()
-        elif theme_name in ["superhero", "darkly"]:
+        elif theme_name in DARK_THEMES:
             self.apply_apple_calculator_dark_style()
         else:
             pass
@@ -751,11 +1216,8 @@ class DailyTimeRecordApp:
         help_menu.add_command(label="How to Use", command=self.show_help_dialog)
         help_menu.add_command(label="About", command=self.show_about_dialog)
         Tooltip(help_menu, "Help and information")
-
-        if self.current_theme == "flatly":
-            self.menubar.config(bg="#FFFFFF", fg="#000000", activebackground="#F2F2F2", activeforeground="#000000")
-        else:
-            self.menubar.config(bg="#2E2E2E", fg="#FFFFFF", activebackground="#3C3C3C", activeforeground="#FFFFFF")
+        # Menubar colors are applied (and re-applied on theme switches) by
+        # apply_style_palette, which runs before this in __init__.
 
     def setup_header(self):
         header_frame = ttkb.Frame(self.master)
@@ -772,7 +1234,7 @@ class DailyTimeRecordApp:
         self.year_combo = ttk.Combobox(
             date_selection_frame,
             textvariable=self.year_var,
-            values=[str(year) for year in range(1900, 2126)],  # 1900-2125
+            values=YEAR_VALUES,
             state="readonly",
             width=5
         )
@@ -785,12 +1247,12 @@ class DailyTimeRecordApp:
         self.month_combo = ttk.Combobox(
             date_selection_frame,
             textvariable=self.month_var,
-            values=[calendar.month_name[i] for i in range(1, 13)],
+            values=MONTH_NAMES,
             state="readonly",
             width=10
         )
         self.month_combo.grid(row=0, column=3, padx=5, pady=2, sticky="w")
-        self.month_combo.set(calendar.month_name[self.selected_date.month])
+        self.month_combo.set(MONTH_NAMES[self.selected_date.month - 1])
         self.month_combo.bind("<<ComboboxSelected>>", self.update_days)
 
         ttk.Label(date_selection_frame, text="Day:").grid(row=0, column=4, padx=5, pady=2, sticky="e")
@@ -798,13 +1260,15 @@ class DailyTimeRecordApp:
         self.day_combo = ttk.Combobox(
             date_selection_frame,
             textvariable=self.day_var,
-            values=[str(day) for day in range(1, 32)],
+            values=DAY_VALUES,
             state="readonly",
             width=3
         )
         self.day_combo.grid(row=0, column=5, padx=5, pady=2, sticky="w")
         self.day_combo.set(str(self.selected_date.day))
         self.day_combo.bind("<<ComboboxSelected>>", self.on_date_change)
+        # Header combos whose selection sets self.selected_date
+        self._date_combos = frozenset((self.year_combo, self.month_combo, self.day_combo))
 
         Tooltip(self.year_combo, "Select Year")
         Tooltip(self.month_combo, "Select Month")
@@ -989,7 +1453,7 @@ class DailyTimeRecordApp:
         self.search_from_year = ttk.Combobox(
             search_frame,
             textvariable=self.search_from_year_var,
-            values=[str(year) for year in range(1900, 2126)],
+            values=YEAR_VALUES,
             state="readonly",
             width=5
         )
@@ -1002,12 +1466,12 @@ class DailyTimeRecordApp:
         self.search_from_month = ttk.Combobox(
             search_frame,
             textvariable=self.search_from_month_var,
-            values=[calendar.month_name[i] for i in range(1, 13)],
+            values=MONTH_NAMES,
             state="readonly",
             width=10
         )
         self.search_from_month.pack(side="left", padx=5)
-        self.search_from_month.set(calendar.month_name[self.selected_date.month])
+        self.search_from_month.set(MONTH_NAMES[self.selected_date.month - 1])
         self.search_from_month.bind("<<ComboboxSelected>>", self.update_search_from_days)
 
         ttk.Label(search_frame, text="From Day:").pack(side="left", padx=5)
@@ -1015,7 +1479,7 @@ class DailyTimeRecordApp:
         self.search_from_day = ttk.Combobox(
             search_frame,
             textvariable=self.search_from_day_var,
-            values=[str(day) for day in range(1, 32)],
+            values=DAY_VALUES,
             state="readonly",
             width=3
         )
@@ -1028,7 +1492,7 @@ class DailyTimeRecordApp:
         self.search_to_year = ttk.Combobox(
             search_frame,
             textvariable=self.search_to_year_var,
-            values=[str(year) for year in range(1900, 2126)],
+            values=YEAR_VALUES,
             state="readonly",
             width=5
         )
@@ -1041,12 +1505,12 @@ class DailyTimeRecordApp:
         self.search_to_month = ttk.Combobox(
             search_frame,
             textvariable=self.search_to_month_var,
-            values=[calendar.month_name[i] for i in range(1, 13)],
+            values=MONTH_NAMES,
             state="readonly",
             width=10
         )
         self.search_to_month.pack(side="left", padx=5)
-        self.search_to_month.set(calendar.month_name[self.selected_date.month])
+        self.search_to_month.set(MONTH_NAMES[self.selected_date.month - 1])
         self.search_to_month.bind("<<ComboboxSelected>>", self.update_search_to_days)
 
         ttk.Label(search_frame, text="To Day:").pack(side="left", padx=5)
@@ -1054,7 +1518,7 @@ class DailyTimeRecordApp:
         self.search_to_day = ttk.Combobox(
             search_frame,
             textvariable=self.search_to_day_var,
-            values=[str(day) for day in range(1, 32)],
+            values=DAY_VALUES,
             state="readonly",
             width=3
         )
@@ -1154,7 +1618,7 @@ class DailyTimeRecordApp:
             self.morning_actual_time_in_hour_var.set('00')
             self.morning_actual_time_in_minute_var.set('00')
             self.morning_actual_time_in_ampm_var.set('AM')
-            self.label_supposed_time_in.config(text="Supposed Time In: --:-- --")
+            self.set_supposed_time_in("--:-- --")
         else:
             self.update_supposed_time_in_label()
 
@@ -1172,7 +1636,7 @@ class DailyTimeRecordApp:
             self.afternoon_actual_time_out_hour_var.set('00')
             self.afternoon_actual_time_out_minute_var.set('00')
             self.afternoon_actual_time_out_ampm_var.set('PM')
-            self.label_supposed_time_out.config(text="Supposed Time Out: --:-- --")
+            self.set_supposed_time_out("--:-- --")
         else:
             self.update_supposed_time_out_label()
 
@@ -1182,51 +1646,49 @@ class DailyTimeRecordApp:
         self.afternoon_actual_time_out_button.config(state=state)
         self.button_clear_afternoon.config(state=state)
 
+    def set_supposed_time_in(self, text):
+        """
+        Show a supposed time in and remember it for calculating and saving.
+        """
+        self._supposed_time_in_text = text
+        self.label_supposed_time_in.config(text=f"Supposed Time In: {text}")
+
+    def set_supposed_time_out(self, text):
+        """
+        Show a supposed time out and remember it for saving.
+        """
+        self._supposed_time_out_text = text
+        self.label_supposed_time_out.config(text=f"Supposed Time Out: {text}")
+
     def update_supposed_time_in_label(self):
-        self.current_day = self.selected_date.strftime("%A")
         if self.morning_check.get():
-            st = ALLOWED_TIMES.get(self.current_day, {}).get("supposed_time_in")
-            sup_in_str = st.strftime("%I:%M %p") if st else "--:-- --"
-            self.label_supposed_time_in.config(text=f"Supposed Time In: {sup_in_str}")
+            self.set_supposed_time_in(SUPPOSED_TIME_IN_TEXT[self.selected_date.weekday()])
         else:
-            self.label_supposed_time_in.config(text="Supposed Time In: --:-- --")
+            self.set_supposed_time_in("--:-- --")
 
     def update_supposed_time_out_label(self):
-        day_name = self.selected_date.strftime("%A")
-
         if not self.afternoon_check.get():
-            self.label_supposed_time_out.config(text="Supposed Time Out: --:-- --")
+            self.set_supposed_time_out("--:-- --")
             return
 
         if self.morning_check.get():
             # Both morning & afternoon => flexi (we'll clamp in calculate_deductions)
-            self.label_supposed_time_out.config(
-                text="Supposed Time Out: (Flexi - Will be determined on Calculate)"
-            )
+            self.set_supposed_time_out("(Flexi - Will be determined on Calculate)")
         else:
-            # Only afternoon
-            # Based on the new swap:
-            if day_name == "Monday":
-                sto = time(17, 0).strftime("%I:%M %p")      # Monday: 5:00 PM
-            else:
-                sto = time(17, 30).strftime("%I:%M %p")     # Tue-Fri: 5:30 PM
-            self.label_supposed_time_out.config(text=f"Supposed Time Out: {sto}")
+            # Only afternoon: Monday 5:00 PM, Tue-Fri 5:30 PM
+            self.set_supposed_time_out(AFTERNOON_ONLY_TIME_OUT_TEXT[self.selected_date.weekday()])
 
     def on_date_change(self, event):
         try:
-            widget = event.widget if event else None
-            if widget in [self.year_combo, self.month_combo, self.day_combo]:
+            # Search combos also land here; they never change self.selected_date
+            if event is not None and event.widget in self._date_combos:
                 year = int(self.year_var.get())
-                month = list(calendar.month_name).index(self.month_var.get())
+                month = MONTH_NUMBERS.get(self.month_var.get(), 0)
                 day = int(self.day_var.get())
                 self.selected_date = datetime(year, month, day).date()
                 self.search_active = False
-            elif widget in [self.search_from_year, self.search_from_month, self.search_from_day,
-                            self.search_to_year, self.search_to_month, self.search_to_day]:
-                # This is related to the search combos. We won't change self.selected_date here.
-                pass
 
-            self.current_day = self.selected_date.strftime("%A")
+            self.current_day = WEEKDAY_NAMES[self.selected_date.weekday()]
             self.label_day.config(text=f"Day: {self.current_day}")
 
             self.update_supposed_time_in_label()
@@ -1237,48 +1699,51 @@ class DailyTimeRecordApp:
             self.label_afternoon_undertime.config(text="Undertime: 0 minutes")
             self.label_afternoon_undertime_deduction.config(text="Undertime Deduction: 0.000")
             self.label_deductions.config(text="Total Deduction Points: 0.000")
+            self._last_late_minutes = 0
+            self._last_undertime_minutes = 0
+            self._last_total_deduction = 0.0
 
             if not self.search_active:
-                self.populate_history_for_selected_date()
+                self.schedule_history_refresh()
 
-            logging.info(f"Date changed to {self.selected_date}")
+            logging.debug("Date changed to %s", self.selected_date)
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid date selected.\n{e}", parent=self.master)
             logging.error(f"Error on date change: {e}")
 
+    def set_day_values(self, combo, day_var, year, month):
+        """
+        Limit a day combobox to the days of the given month and clamp its
+        value; the Tk values list is only replaced when the day count changes.
+        """
+        values = day_values(year, month)
+        if self._day_values.get(str(combo), DAY_VALUES) != values:
+            combo['values'] = values
+            self._day_values[str(combo)] = values
+        if int(day_var.get()) > len(values):
+            day_var.set(values[-1])
+
     def update_days(self, event):
         try:
             year = int(self.year_var.get())
-            month = list(calendar.month_name).index(self.month_var.get())
-            num_days = calendar.monthrange(year, month)[1]
-            days = [str(day) for day in range(1, num_days + 1)]
-            self.day_combo['values'] = days
-            if int(self.day_var.get()) > num_days:
-                self.day_var.set(str(num_days))
+            month = MONTH_NUMBERS.get(self.month_var.get(), 0)
+            self.set_day_values(self.day_combo, self.day_var, year, month)
         except Exception as e:
             logging.error(f"Error updating days: {e}")
 
     def update_search_from_days(self, event):
         try:
             year = int(self.search_from_year_var.get())
-            month = list(calendar.month_name).index(self.search_from_month_var.get())
-            num_days = calendar.monthrange(year, month)[1]
-            days = [str(day) for day in range(1, num_days + 1)]
-            self.search_from_day['values'] = days
-            if int(self.search_from_day_var.get()) > num_days:
-                self.search_from_day_var.set(str(num_days))
+            month = MONTH_NUMBERS.get(self.search_from_month_var.get(), 0)
+            self.set_day_values(self.search_from_day, self.search_from_day_var, year, month)
         except Exception as e:
             logging.error(f"Error updating search from days: {e}")
 
     def update_search_to_days(self, event):
         try:
             year = int(self.search_to_year_var.get())
-            month = list(calendar.month_name).index(self.search_to_month_var.get())
-            num_days = calendar.monthrange(year, month)[1]
-            days = [str(day) for day in range(1, num_days + 1)]
-            self.search_to_day['values'] = days
-            if int(self.search_to_day_var.get()) > num_days:
-                self.search_to_day_var.set(str(num_days))
+            month = MONTH_NUMBERS.get(self.search_to_month_var.get(), 0)
+            self.set_day_values(self.search_to_day, self.search_to_day_var, year, month)
         except Exception as e:
             logging.error(f"Error updating search to days: {e}")
 
@@ -1290,7 +1755,8 @@ class DailyTimeRecordApp:
         label.pack(side="left", padx=5)
 
         hour_var = tk.StringVar(value='00')
-        hour_entry = ttk.Entry(frame, textvariable=hour_var, width=3, justify='center', style="TEntry")
+        hour_entry = ttk.Entry(frame, textvariable=hour_var, width=3, justify='center', style="TEntry",
+                               validate="key", validatecommand=self._two_digit_vcmd)
         hour_entry.pack(side="left", padx=(0, 2))
         Tooltip(hour_entry, "Enter hours (01-12)")
         self.register_time_validation(hour_entry, hour_var, part='hour')
@@ -1303,7 +1769,8 @@ class DailyTimeRecordApp:
         colon_label.pack(side="left")
 
         minute_var = tk.StringVar(value='00')
-        minute_entry = ttk.Entry(frame, textvariable=minute_var, width=3, justify='center', style="TEntry")
+        minute_entry = ttk.Entry(frame, textvariable=minute_var, width=3, justify='center', style="TEntry",
+                                 validate="key", validatecommand=self._two_digit_vcmd)
         minute_entry.pack(side="left", padx=(2, 5))
         Tooltip(minute_entry, "Enter minutes (00-59)")
         self.register_time_validation(minute_entry, minute_var, part='minute')
@@ -1317,7 +1784,7 @@ class DailyTimeRecordApp:
             # Condition #1: Default PM for afternoon time out
             ampm_var.set("PM")
 
-        ampm_combo = ttk.Combobox(frame, textvariable=ampm_var, values=["AM", "PM"], state="readonly", width=3)
+        ampm_combo = ttk.Combobox(frame, textvariable=ampm_var, values=AMPM_VALUES, state="readonly", width=3)
         ampm_combo.pack(side="left", padx=(0, 5))
         Tooltip(ampm_combo, "Select AM or PM")
 
@@ -1334,31 +1801,36 @@ class DailyTimeRecordApp:
         setattr(self, f'{attr_name}_ampm_combo', ampm_combo)
         setattr(self, f'{attr_name}_button', time_button)
 
-        hour_entry.bind("<KeyRelease>", self.create_time_input_key_release(hour_var, part='hour'))
-        minute_entry.bind("<KeyRelease>", self.create_time_input_key_release(minute_var, part='minute'))
+        self._fields[attr_name] = SimpleNamespace(
+            hour=hour_var, minute=minute_var, ampm=ampm_var,
+            hour_entry=hour_entry, minute_entry=minute_entry,
+            ampm_combo=ampm_combo, button=time_button
+        )
+
         hour_entry.bind("<Return>", self.enter_key_pressed)
         minute_entry.bind("<Return>", self.enter_key_pressed)
         ampm_combo.bind("<Return>", self.enter_key_pressed)
         time_button.bind("<Return>", self.enter_key_pressed)
 
     def register_time_validation(self, entry, var, part='hour'):
+        low, high = (1, 12) if part == 'hour' else (0, 59)
+        last_validated = [None]
+        last_valid = [None]
+
         def validate(*args):
             value = var.get()
-            if part == 'hour':
-                try:
-                    if not (1 <= int(value) <= 12):
-                        self.apply_error_style(entry)
-                    else:
-                        self.apply_normal_style(entry)
-                except ValueError:
-                    self.apply_error_style(entry)
-            elif part == 'minute':
-                try:
-                    if not (0 <= int(value) <= 59):
-                        self.apply_error_style(entry)
-                    else:
-                        self.apply_normal_style(entry)
-                except ValueError:
+            # Skip re-validating (and re-styling) an unchanged value
+            if value == last_validated[0]:
+                return
+            last_validated[0] = value
+            valid = value.isascii() and value.isdigit() and low <= int(value) <= high
+            # Only touch the widget when the value flips between valid/invalid;
+            # theme switches recolor valid entries in refresh_all_widget_colors
+            if valid != last_valid[0]:
+                last_valid[0] = valid
+                if valid:
+                    self.apply_normal_style(entry)
+                else:
                     self.apply_error_style(entry)
         var.trace_add('write', validate)
 
@@ -1366,24 +1838,20 @@ class DailyTimeRecordApp:
         widget.configure(foreground="red")
 
     def apply_normal_style(self, widget):
-        if self.current_theme == 'flatly':
-            widget.configure(foreground="black")
-        else:
-            widget.configure(foreground="white")
+        widget.configure(foreground=self._text_fg)
 
-    def create_time_input_key_release(self, var, part='hour'):
-        def on_key_release(event):
-            current_text = var.get().strip().upper()
-            new_text = ''.join(filter(str.isdigit, current_text))
-            if len(new_text) > 2:
-                new_text = new_text[:2]
-            var.set(new_text)
-        return on_key_release
+    def is_two_digit_input(self, proposed):
+        """
+        validatecommand for the hour/minute entries: only accept edits that
+        leave at most two digits in the entry.
+        """
+        return proposed == "" or (len(proposed) <= 2 and proposed.isascii() and proposed.isdigit())
 
     def open_time_picker(self, attr_name):
-        hour_var = getattr(self, f'{attr_name}_hour_var')
-        minute_var = getattr(self, f'{attr_name}_minute_var')
-        ampm_var = getattr(self, f'{attr_name}_ampm_var')
+        field = self._fields[attr_name]
+        hour_var = field.hour
+        minute_var = field.minute
+        ampm_var = field.ampm
 
         try:
             hour = int(hour_var.get())
@@ -1399,8 +1867,9 @@ class DailyTimeRecordApp:
         except ValueError:
             time_obj = None
 
-        picker = TimePickerDialog(self.master, initial_time=time_obj, title=f"Select {attr_name.replace('_', ' ').title()}")
-        selected_time = picker.show()
+        selected_time = open_time_picker_dialog(
+            self, self.master, time_obj, f"Select {attr_name.replace('_', ' ').title()}", app=self
+        )
         if selected_time:
             hour_12 = selected_time.hour % 12
             hour_12 = 12 if hour_12 == 0 else hour_12
@@ -1412,30 +1881,31 @@ class DailyTimeRecordApp:
             ampm_var.set(ampm)
 
     def parse_time_input(self, attr_name):
-        hour_var = getattr(self, f'{attr_name}_hour_var')
-        minute_var = getattr(self, f'{attr_name}_minute_var')
-        ampm_var = getattr(self, f'{attr_name}_ampm_var')
+        field = self._fields[attr_name]
+        hour_var = field.hour
+        minute_var = field.minute
+        ampm_var = field.ampm
 
         time_str = f"{hour_var.get()}:{minute_var.get()} {ampm_var.get()}"
         try:
-            return datetime.strptime(time_str, "%I:%M %p").time()
+            return parse_time_12h(time_str)
         except ValueError:
             return None
 
     def calculate_time_difference(self, earlier_time, later_time):
-        dt1 = datetime.combine(self.selected_date, earlier_time)
-        dt2 = datetime.combine(self.selected_date, later_time)
-        delta_minutes = (dt2 - dt1).total_seconds() // 60
-        return int(delta_minutes)
+        # Both times are on the same day, so plain minute arithmetic is enough
+        return (later_time.hour * 60 + later_time.minute) - (earlier_time.hour * 60 + earlier_time.minute)
 
     def calculate_deductions(self):
         total_late_deduction = 0.0
         total_undertime_deduction = 0.0
+        morning_checked = self.morning_check.get()
+        afternoon_checked = self.afternoon_check.get()
 
         # -------------------------------
         #   Handle Morning (Late)
         # -------------------------------
-        if self.morning_check.get():
+        if morning_checked:
             morning_actual_time_in = self.parse_time_input("morning_actual_time_in")
             if not morning_actual_time_in:
                 messagebox.showerror("Input Error", "Please enter a valid Actual Time In (Morning) or uncheck it.",
@@ -1443,10 +1913,10 @@ class DailyTimeRecordApp:
                 logging.warning("Invalid Actual Time In for Morning.")
                 return
 
-            # Suppose Time In from label
-            supposed_time_in_str = self.label_supposed_time_in.cget("text").split(": ", 1)[1]
+            # Supposed Time In as currently shown
+            supposed_time_in_str = self._supposed_time_in_text
             try:
-                supposed_time_in = datetime.strptime(supposed_time_in_str, "%I:%M %p").time()
+                supposed_time_in = parse_time_12h(supposed_time_in_str)
             except ValueError:
                 supposed_time_in = None
 
@@ -1458,79 +1928,45 @@ class DailyTimeRecordApp:
             late_minutes_raw = self.calculate_time_difference(supposed_time_in, morning_actual_time_in)
             late_minutes = max(0, late_minutes_raw)
             self.label_morning_late.config(text=f"Late: {late_minutes} minutes")
+            self._last_late_minutes = late_minutes
 
-            late_deduction = convert_time_diff_to_day_fraction(
-                late_minutes // 60,
-                late_minutes % 60
-            )
+            late_deduction = convert_minutes_to_day_fraction(late_minutes)
             self.label_morning_late_deduction.config(text=f"Late Deduction: {late_deduction:.3f}")
             total_late_deduction = late_deduction
         else:
             self.label_morning_late.config(text="Late: 0 minutes")
             self.label_morning_late_deduction.config(text="Late Deduction: 0.000")
+            self._last_late_minutes = 0
 
         # -------------------------------
         #  Determine Supposed Time Out (Flexi scenario clamp)
         # -------------------------------
-        day_name = self.current_day
+        weekday = self.selected_date.weekday()
 
         supposed_time_out = None
 
-        if self.morning_check.get() and self.afternoon_check.get():
+        if morning_checked and afternoon_checked:
             # FLEXI: In your original code, we do in_minutes + 540 => clamp
             morning_in = self.parse_time_input("morning_actual_time_in")
             if not morning_in:
                 return
 
-            in_minutes = morning_in.hour * 60 + morning_in.minute
-            # Original clamp: 7:30 => 450, 8:30 => 510
-            if in_minutes < 450:
-                in_minutes = 450
-            elif in_minutes > 510:
-                in_minutes = 510
-
-            # 9 hours after
-            out_minutes = in_minutes + 540
-
-            # NEW: If Monday => clamp 16:30 (990) to 17:00 (1020)
-            # Otherwise => clamp 16:30 (990) to 17:30 (1050)
-            if day_name == "Monday":
-                if out_minutes < 990:
-                    out_minutes = 990
-                elif out_minutes > 1020:
-                    out_minutes = 1020
-            else:
-                if out_minutes < 990:
-                    out_minutes = 990
-                elif out_minutes > 1050:
-                    out_minutes = 1050
-
-            out_hour = out_minutes // 60
-            out_minute = out_minutes % 60
-            supposed_time_out = time(out_hour, out_minute)
-            self.label_supposed_time_out.config(
-                text=f"Supposed Time Out: {supposed_time_out.strftime('%I:%M %p')}"
-            )
+            # 9 hours after the clamped time in; Monday ends by 5:00 PM
+            supposed_time_out = flexi_time_out(morning_in, weekday)
+            self.set_supposed_time_out(supposed_time_out.strftime("%I:%M %p"))
 
-        elif not self.morning_check.get() and self.afternoon_check.get():
-            # Only afternoon
-            # If Monday => 5:00 PM, else => 5:30 PM
-            if day_name == "Monday":
-                supposed_time_out = time(17, 0)  # 5:00 PM
-            else:
-                supposed_time_out = time(17, 30) # 5:30 PM
-
-            self.label_supposed_time_out.config(
-                text=f"Supposed Time Out: {supposed_time_out.strftime('%I:%M %p')}"
-            )
+        elif not morning_checked and afternoon_checked:
+            # Only afternoon: Monday 5:00 PM, else 5:30 PM
+            supposed_time_out = AFTERNOON_ONLY_TIME_OUT[weekday]
+            self.set_supposed_time_out(AFTERNOON_ONLY_TIME_OUT_TEXT[weekday])
 
         else:
-            self.label_supposed_time_out.config(text="Supposed Time Out: --:-- --")
+            self.set_supposed_time_out("--:-- --")
 
         # -------------------------------
         #   Handle Afternoon (Undertime)
         # -------------------------------
-        if self.afternoon_check.get():
+        if afternoon_checked:
             afternoon_actual_time_out = self.parse_time_input("afternoon_actual_time_out")
             if not afternoon_actual_time_out:
                 messagebox.showerror("Input Error", "Please enter a valid Actual Time Out (Afternoon) or uncheck it.",
@@ -1545,36 +1981,38 @@ class DailyTimeRecordApp:
                 undertime_minutes = 0
 
             self.label_afternoon_undertime.config(text=f"Undertime: {undertime_minutes} minutes")
+            self._last_undertime_minutes = undertime_minutes
 
-            undertime_deduction = convert_time_diff_to_day_fraction(
-                undertime_minutes // 60,
-                undertime_minutes % 60
-            )
+            undertime_deduction = convert_minutes_to_day_fraction(undertime_minutes)
             self.label_afternoon_undertime_deduction.config(text=f"Undertime Deduction: {undertime_deduction:.3f}")
             total_undertime_deduction = undertime_deduction
         else:
             self.label_afternoon_undertime.config(text="Undertime: 0 minutes")
             self.label_afternoon_undertime_deduction.config(text="Undertime Deduction: 0.000")
+            self._last_undertime_minutes = 0
 
         # half-day check
-        half_day_absences = 0
-        if not self.morning_check.get():
-            half_day_absences += 1
-        if not self.afternoon_check.get():
-            half_day_absences += 1
-
-        half_day_deduction = half_day_absences * 0.5
+        half_day_deduction = HALF_DAY_DEDUCTIONS[(morning_checked << 1) | afternoon_checked]
         total_deduction = round(total_late_deduction + total_undertime_deduction + half_day_deduction, 3)
         self.label_deductions.config(text=f"Total Deduction Points: {total_deduction:.3f}")
+        self._last_total_deduction = total_deduction
 
         logging.info(
             f"Calculated Deductions. Late: {total_late_deduction}, "
             f"Undertime: {total_undertime_deduction}, "
-            f"Half-day(s): {half_day_absences * 0.5}, "
+            f"Half-day(s): {half_day_deduction}, "
             f"Total: {total_deduction}"
         )
 
     def enter_key_pressed(self, event):
+        # Coalesce repeated Enter presses into one recalculation when Tk is idle
+        if self._recalc_pending:
+            return
+        self._recalc_pending = True
+        self.master.after_idle(self._do_recalc)
+
+    def _do_recalc(self):
+        self._recalc_pending = False
         self.calculate_deductions()
 
     def clear_morning(self):
@@ -1584,10 +2022,13 @@ class DailyTimeRecordApp:
 
         self.label_morning_late.config(text="Late: 0 minutes")
         self.label_morning_late_deduction.config(text="Late Deduction: 0.000")
-        self.label_supposed_time_out.config(text="Supposed Time Out: --:-- --")
+        self.set_supposed_time_out("--:-- --")
         self.label_afternoon_undertime.config(text="Undertime: 0 minutes")
         self.label_afternoon_undertime_deduction.config(text="Undertime Deduction: 0.000")
         self.label_deductions.config(text="Total Deduction Points: 0.000")
+        self._last_late_minutes = 0
+        self._last_undertime_minutes = 0
+        self._last_total_deduction = 0.0
 
         logging.info("Cleared Morning inputs.")
 
@@ -1599,6 +2040,8 @@ class DailyTimeRecordApp:
         self.label_afternoon_undertime.config(text="Undertime: 0 minutes")
         self.label_afternoon_undertime_deduction.config(text="Undertime Deduction: 0.000")
         self.label_deductions.config(text="Total Deduction Points: 0.000")
+        self._last_undertime_minutes = 0
+        self._last_total_deduction = 0.0
 
         logging.info("Cleared Afternoon inputs.")
 
@@ -1622,47 +2065,34 @@ class DailyTimeRecordApp:
     # SAVE / LOAD / EXPORT
     # ------------------------------------------------------------------------
     def save_record(self):
-        try:
-            deduction_text = self.label_deductions.cget("text").split(":")[1].strip()
-            deduction_points = float(deduction_text)
-        except (IndexError, ValueError):
-            messagebox.showerror("Error", "Unable to parse deduction points.", parent=self.master)
-            logging.error("Failed to parse deduction points for saving.")
-            return
+        deduction_points = self._last_total_deduction
 
-        date_str = self.selected_date.strftime("%Y-%m-%d")
+        date_str = self.selected_date.isoformat()
 
         if self.morning_check.get():
             morning_time_in = (
-                getattr(self, 'morning_actual_time_in_hour_var').get().zfill(2) + ":" +
-                getattr(self, 'morning_actual_time_in_minute_var').get().zfill(2) + " " +
-                getattr(self, 'morning_actual_time_in_ampm_var').get()
+                self.morning_actual_time_in_hour_var.get().zfill(2) + ":" +
+                self.morning_actual_time_in_minute_var.get().zfill(2) + " " +
+                self.morning_actual_time_in_ampm_var.get()
             )
         else:
             morning_time_in = "--:-- --"
 
-        supposed_time_in = self.label_supposed_time_in.cget("text").split(": ", 1)[1]
+        supposed_time_in = self._supposed_time_in_text
 
         if self.afternoon_check.get():
             afternoon_time_out = (
-                getattr(self, 'afternoon_actual_time_out_hour_var').get().zfill(2) + ":" +
-                getattr(self, 'afternoon_actual_time_out_minute_var').get().zfill(2) + " " +
-                getattr(self, 'afternoon_actual_time_out_ampm_var').get()
+                self.afternoon_actual_time_out_hour_var.get().zfill(2) + ":" +
+                self.afternoon_actual_time_out_minute_var.get().zfill(2) + " " +
+                self.afternoon_actual_time_out_ampm_var.get()
             )
         else:
             afternoon_time_out = "--:-- --"
 
-        supposed_time_out = self.label_supposed_time_out.cget("text").split(": ", 1)[1]
+        supposed_time_out = self._supposed_time_out_text
 
-        late_minutes = 0
-        if self.morning_check.get():
-            late_minutes_str = self.label_morning_late.cget("text").split(":")[1].strip().split()[0]
-            late_minutes = int(late_minutes_str)
-
-        undertime_minutes = 0
-        if self.afternoon_check.get():
-            undertime_minutes_str = self.label_afternoon_undertime.cget("text").split(":")[1].strip().split()[0]
-            undertime_minutes = int(undertime_minutes_str)
+        late_minutes = self._last_late_minutes if self.morning_check.get() else 0
+        undertime_minutes = self._last_undertime_minutes if self.afternoon_check.get() else 0
 
         new_record = {
             "date": date_str,
@@ -1672,11 +2102,11 @@ class DailyTimeRecordApp:
             "afternoon_actual_time_out": afternoon_time_out,
             "supposed_time_out": supposed_time_out,
             "undertime_minutes": undertime_minutes,
-            "deduction_points": deduction_points
+            "deduction_points": deduction_points,
+            "_date_obj": self.selected_date
         }
 
-        existing_records = [record for record in self.records if record["date"] == date_str]
-        if existing_records:
+        if self._records_by_date.get(date_str):
             add_record = messagebox.askyesno(
                 "Add Record",
                 f"A record for {date_str} already exists.\nDo you want to add another record for this date?",
@@ -1687,6 +2117,9 @@ class DailyTimeRecordApp:
                 return
 
         self.records.insert(0, new_record)
+        if date_str not in self._records_by_date:
+            insort(self._sorted_dates, date_str)
+        self._records_by_date.setdefault(date_str, []).insert(0, new_record)
 
         self.save_records_to_file()
 
@@ -1697,8 +2130,13 @@ class DailyTimeRecordApp:
         )
         logging.info(f"Record saved for {date_str}: {deduction_points} points.")
 
-        # After saving, re-filter and show the new data for the selected date
-        self.populate_history_for_selected_date()
+        # After saving, show the new data for the selected date. When the
+        # tree already shows that date, only the new row needs adding.
+        if self.search_active:
+            self.populate_history_for_selected_date()
+        else:
+            self.current_records.insert(0, new_record)
+            self.insert_history_row(new_record, index=0)
 
     def export_history(self):
         if not self.records:
@@ -1706,6 +2144,10 @@ class DailyTimeRecordApp:
             logging.info("Export attempted with no records.")
             return
 
+        # Only needed for exporting, so keep them out of the startup imports
+        import csv
+        from tkinter import filedialog
+
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
@@ -1715,29 +2157,12 @@ class DailyTimeRecordApp:
             return
 
         try:
-            with open(file_path, 'w', newline='') as csvfile:
+            with open(file_path, 'w', newline='', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerow([
-                    "Date",
-                    "Morning Actual Time In",
-                    "Supposed Time In",
-                    "Late Minutes",
-                    "Afternoon Actual Time Out",
-                    "Supposed Time Out",
-                    "Undertime Minutes",
-                    "Deduction Points"
-                ])
-                for record in sorted(self.records, key=lambda x: x["date"], reverse=True):
-                    writer.writerow([
-                        record["date"],
-                        record.get("morning_actual_time_in", "--:-- --"),
-                        record.get("supposed_time_in", "--:-- --"),
-                        record.get("late_minutes", 0),
-                        record.get("afternoon_actual_time_out", "--:-- --"),
-                        record.get("supposed_time_out", "--:-- --"),
-                        record.get("undertime_minutes", 0),
-                        record["deduction_points"]
-                    ])
+                writer.writerow(HISTORY_COLUMNS)
+                # Records always carry every field, so a single itemgetter
+                # builds each row and writerows streams them in one call.
+                writer.writerows(map(record_values, self.records_newest_first()))
             messagebox.showinfo("Export Successful", f"History exported to {file_path}", parent=self.master)
             logging.info(f"History exported to {file_path}")
         except Exception as e:
@@ -1763,53 +2188,37 @@ class DailyTimeRecordApp:
             messagebox.showinfo("Edit Record", "Please select only one record at a time to edit.", parent=self.master)
             return
 
-        item = selected_items[0]
-        values = self.history_tree.item(item, 'values')
-        date_str = values[0]
-        morning_in_str = values[1]
-        afternoon_out_str = values[4]
-
-        record_index = None
-        for i, record in enumerate(self.records):
-            if (record["date"] == date_str and
-                record["morning_actual_time_in"] == morning_in_str and
-                record["afternoon_actual_time_out"] == afternoon_out_str):
-                record_index = i
-                break
-
-        if record_index is None:
+        record_to_edit = self._tree_records.get(selected_items[0])
+        if record_to_edit is None:
             messagebox.showerror("Error", "Selected record not found.", parent=self.master)
             return
+        if record_to_edit["_date_obj"] is None:
+            # Recalculating needs the weekday, so the date must be fixed first
+            messagebox.showerror("Edit Record", f"The date \"{record_to_edit['date']}\" of this record is not valid.",
+                                 parent=self.master)
+            return
 
-        record_to_edit = self.records[record_index]
-        EditRecordDialog(self.master, record_to_edit, self.save_edited_record)
+        EditRecordDialog(self.master, record_to_edit, self.save_edited_record, app=self)
 
     def save_edited_record(self, updated_record):
         self.recalc_single_record(updated_record)
         self.save_records_to_file()
-        if self.search_active:
-            self.current_records = [r for r in self.records if r in self.current_records or r["date"] == r["date"]]
-            self.populate_history(self.current_records)
-        else:
-            self.populate_history_for_selected_date()
+        iid = str(id(updated_record))
+        if iid in self._tree_records:
+            self.history_tree.item(iid, values=record_values(updated_record))
 
         messagebox.showinfo("Success", f"Record for {updated_record['date']} updated successfully.", parent=self.master)
         logging.info(f"Record updated for {updated_record['date']} with new times.")
 
     def recalc_single_record(self, record):
-        date_str = record["date"]
-        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
-        day_name = dt.strftime("%A")
+        dt = record["_date_obj"]
 
         morning_in_str = record["morning_actual_time_in"]
         if morning_in_str and morning_in_str != "--:-- --":
             morning_time = self.str_to_time(morning_in_str)
 
-            st = ALLOWED_TIMES.get(day_name, {}).get("supposed_time_in")
-            if st:
-                record["supposed_time_in"] = st.strftime("%I:%M %p")
-            else:
-                record["supposed_time_in"] = "--:-- --"
+            st = SUPPOSED_TIME_IN[dt.weekday()]
+            record["supposed_time_in"] = SUPPOSED_TIME_IN_TEXT[dt.weekday()]
 
             late_minutes = 0
             if morning_time and st:
@@ -1831,37 +2240,13 @@ class DailyTimeRecordApp:
         if record["morning_actual_time_in"] != "--:-- --" and afternoon_time:
             morning_time = self.str_to_time(record["morning_actual_time_in"])
             if morning_time:
-                in_minutes = morning_time.hour * 60 + morning_time.minute
-                if in_minutes < 450:
-                    in_minutes = 450
-                elif in_minutes > 510:
-                    in_minutes = 510
-                out_minutes = in_minutes + 540
-
-                # Monday => clamp 16:30..17:00, else => 16:30..17:30
-                if day_name == "Monday":
-                    if out_minutes < 990:
-                        out_minutes = 990
-                    elif out_minutes > 1020:
-                        out_minutes = 1020
-                else:
-                    if out_minutes < 990:
-                        out_minutes = 990
-                    elif out_minutes > 1050:
-                        out_minutes = 1050
-
-                out_h = out_minutes // 60
-                out_m = out_minutes % 60
-                sup_time_out = time(out_h, out_m)
+                sup_time_out = flexi_time_out(morning_time, dt.weekday())
                 record["supposed_time_out"] = sup_time_out.strftime("%I:%M %p")
             else:
                 record["supposed_time_out"] = "--:-- --"
         elif record["morning_actual_time_in"] == "--:-- --" and afternoon_time:
             # Only afternoon
-            if day_name == "Monday":
-                record["supposed_time_out"] = time(17, 0).strftime("%I:%M %p")
-            else:
-                record["supposed_time_out"] = time(17, 30).strftime("%I:%M %p")
+            record["supposed_time_out"] = AFTERNOON_ONLY_TIME_OUT_TEXT[dt.weekday()]
         else:
             record["supposed_time_out"] = "--:-- --"
 
@@ -1880,17 +2265,43 @@ class DailyTimeRecordApp:
             half_days += 1
         half_day_deduction = half_days * 0.5
 
-        late_ded = convert_time_diff_to_day_fraction(
-            record["late_minutes"] // 60, record["late_minutes"] % 60
-        )
-        undertime_ded = convert_time_diff_to_day_fraction(
-            record["undertime_minutes"] // 60, record["undertime_minutes"] % 60
-        )
+        late_ded = convert_minutes_to_day_fraction(record["late_minutes"])
+        undertime_ded = convert_minutes_to_day_fraction(record["undertime_minutes"])
         record["deduction_points"] = round(late_ded + undertime_ded + half_day_deduction, 3)
 
+    def rebuild_records_index(self):
+        """
+        Rebuild the date -> records lookup from self.records.
+        """
+        self._records_by_date = {}
+        self._undated_records = []
+        for record in self.records:
+            record_date = record["_date_obj"]
+            if record_date is None:
+                self._undated_records.append(record)
+            else:
+                self._records_by_date.setdefault(record_date.isoformat(), []).append(record)
+        self._sorted_dates = sorted(self._records_by_date)
+
+    def records_newest_first(self, from_str=None, to_str=None):
+        """
+        Return records ordered by date, newest first, optionally limited to the
+        inclusive "YYYY-MM-DD" range from_str..to_str. Records sharing a date
+        keep their order from self.records.
+        """
+        dates = self._sorted_dates
+        lo = 0 if from_str is None else bisect_left(dates, from_str)
+        hi = len(dates) if to_str is None else bisect_right(dates, to_str)
+        by_date = self._records_by_date
+        records = [record for date_str in reversed(dates[lo:hi]) for record in by_date[date_str]]
+        if from_str is None and to_str is None:
+            # Unfiltered listings still include records with unreadable dates
+            records.extend(self._undated_records)
+        return records
+
     def str_to_time(self, time_str):
         try:
-            return datetime.strptime(time_str, "%I:%M %p").time()
+            return parse_time_12h(time_str)
         except:
             return None
 
@@ -1910,31 +2321,18 @@ class DailyTimeRecordApp:
         if not confirm:
             return
 
-        to_delete = []
-        for item in selected_items:
-            values = self.history_tree.item(item, 'values')
-            date_str = values[0]
-            morning_in_str = values[1]
-            afternoon_out_str = values[4]
-            idx_to_remove = None
-            for i, record in enumerate(self.records):
-                if (record["date"] == date_str and
-                    record["morning_actual_time_in"] == morning_in_str and
-                    record["afternoon_actual_time_out"] == afternoon_out_str):
-                    idx_to_remove = i
-                    break
-            if idx_to_remove is not None:
-                to_delete.append(idx_to_remove)
-
-        for idx in sorted(to_delete, reverse=True):
-            self.records.pop(idx)
+        to_delete = [self._tree_records.pop(item) for item in selected_items if item in self._tree_records]
+
+        # Drop the deleted records in one pass over each list
+        deleted_ids = {id(record) for record in to_delete}
+        self.records = [r for r in self.records if id(r) not in deleted_ids]
+        self.current_records = [r for r in self.current_records if id(r) not in deleted_ids]
+        self.rebuild_records_index()
 
         self.save_records_to_file()
 
-        if self.search_active:
-            self.search_history()  # Re-run the search
-        else:
-            self.populate_history_for_selected_date()
+        # Drop only the deleted rows instead of rebuilding the tree
+        self.history_tree.delete(*selected_items)
 
         messagebox.showinfo("Deleted", f"Selected record(s) have been deleted.", parent=self.master)
         logging.info(f"Deleted {num_selected} record(s).")
@@ -1942,12 +2340,12 @@ class DailyTimeRecordApp:
     def search_history(self):
         try:
             from_year = int(self.search_from_year_var.get())
-            from_month = list(calendar.month_name).index(self.search_from_month_var.get())
+            from_month = MONTH_NUMBERS.get(self.search_from_month_var.get(), 0)
             from_day = int(self.search_from_day_var.get())
             from_date = datetime(from_year, from_month, from_day).date()
 
             to_year = int(self.search_to_year_var.get())
-            to_month = list(calendar.month_name).index(self.search_to_month_var.get())
+            to_month = MONTH_NUMBERS.get(self.search_to_month_var.get(), 0)
             to_day = int(self.search_to_day_var.get())
             to_date = datetime(to_year, to_month, to_day).date()
 
@@ -1956,10 +2354,7 @@ class DailyTimeRecordApp:
                 logging.warning("Invalid search date range.")
                 return
 
-            filtered_records = [
-                record for record in self.records
-                if from_date <= datetime.strptime(record["date"], "%Y-%m-%d").date() <= to_date
-            ]
+            filtered_records = self.records_newest_first(from_date.isoformat(), to_date.isoformat())
             self.current_records = filtered_records
             self.search_active = True
             self.populate_history(filtered_records)
@@ -1972,8 +2367,7 @@ class DailyTimeRecordApp:
     def load_records(self):
         if os.path.exists(DATA_FILE):
             try:
-                with open(DATA_FILE, 'r') as f:
-                    data = json.load(f)
+                data = read_records_file(DATA_FILE)
 
                 if isinstance(data, list):
                     valid_records = []
@@ -1985,7 +2379,10 @@ class DailyTimeRecordApp:
                             record.setdefault("afternoon_actual_time_out", "--:-- --")
                             record.setdefault("supposed_time_out", "--:-- --")
                             record.setdefault("undertime_minutes", 0)
+                            # Keep records with unreadable dates so saving never drops them
+                            record["_date_obj"] = record_date_or_none(record["date"])
                             valid_records.append(record)
+                    self.warn_undated_records(valid_records)
                     return valid_records
                 elif isinstance(data, dict):
                     # old format => transform
@@ -1999,10 +2396,12 @@ class DailyTimeRecordApp:
                             "afternoon_actual_time_out": "--:-- --",
                             "supposed_time_out": "--:-- --",
                             "undertime_minutes": 0,
-                            "deduction_points": ded_val
+                            "deduction_points": ded_val,
+                            "_date_obj": record_date_or_none(date_str)
                         })
-                    with open(DATA_FILE, 'w') as fw:
-                        json.dump(records, fw, indent=4)
+                    self.warn_undated_records(records)
+                    with open(DATA_FILE, 'wb', buffering=JSON_IO_BUFFER) as fw:
+                        fw.write(dump_json_bytes(serialize_records(records)))
                     return records
                 else:
                     logging.warning("Unknown data format. Starting empty.")
@@ -2019,37 +2418,90 @@ class DailyTimeRecordApp:
             logging.info("No existing records found. Starting fresh.")
             return []
 
+    def warn_undated_records(self, records):
+        """
+        Tell the user about loaded records whose date can't be read. They are
+        kept (and saved back unchanged) but left out of date lookups.
+        """
+        undated = [record["date"] for record in records if record["_date_obj"] is None]
+        if not undated:
+            return
+        logging.warning(f"Loaded {len(undated)} record(s) with invalid dates: {undated}")
+        messagebox.showwarning(
+            "Invalid Dates",
+            f"{len(undated)} record(s) in {DATA_FILE} have an invalid date and were kept as-is.\n"
+            "They are listed at the end of exports but not shown by date or search, "
+            "and can't be edited until their date is fixed.",
+            parent=self.master
+        )
+
     def save_records_to_file(self):
+        """
+        Queue a snapshot of the records for the background writer and return
+        immediately. A snapshot still waiting to be written is replaced.
+        """
+        snapshot = serialize_records(self.records)
+        try:
+            self._save_queue.get_nowait()
+            self._save_queue.task_done()
+        except queue.Empty:
+            pass
+        self._save_queue.put(snapshot)
+
+    def flush_pending_saves(self):
+        """
+        Block until every queued snapshot has been written to disk.
+        """
+        self._save_queue.join()
+
+    def _save_worker(self):
+        while True:
+            records = self._save_queue.get()
+            try:
+                self.write_records(records)
+            finally:
+                self._save_queue.task_done()
+
+    def write_records(self, records):
+        """
+        Write records to DATA_FILE via a temp file and an atomic rename.
+        Runs on the background writer thread.
+        """
+        tmp_path = DATA_FILE + ".tmp"
         try:
-            with open(DATA_FILE, 'w') as f:
-                json.dump(self.records, f, indent=4)
+            with open(tmp_path, 'wb', buffering=JSON_IO_BUFFER) as f:
+                f.write(dump_json_bytes(records))
+                # Make sure the data is on disk before it replaces the old file
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, DATA_FILE)
             logging.info("Records saved successfully.")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save records: {e}", parent=self.master)
             logging.error(f"Error saving records: {e}")
+            self._save_errors.put(f"Failed to save records: {e}")
+
+    def take_save_errors(self):
+        """
+        Return and clear the error messages reported by the background writer.
+        """
+        errors = []
+        while True:
+            try:
+                errors.append(self._save_errors.get_nowait())
+            except queue.Empty:
+                return errors
+
+    def poll_save_errors(self):
+        # Runs on the Tk thread; the writer thread only queues the messages
+        for message in self.take_save_errors():
+            messagebox.showerror("Error", message, parent=self.master)
+        self.master.after(SAVE_ERROR_POLL_INTERVAL, self.poll_save_errors)
 
     def sort_by_column(self, col):
         self.sort_states[col] = not self.sort_states[col]
         reverse = self.sort_states[col]
 
-        if col == "Late Minutes":
-            key_func = lambda x: float(x["late_minutes"])
-        elif col == "Undertime Minutes":
-            key_func = lambda x: float(x["undertime_minutes"])
-        elif col == "Deduction Points":
-            key_func = lambda x: float(x["deduction_points"])
-        elif col == "Date":
-            key_func = lambda x: datetime.strptime(x["date"], "%Y-%m-%d")
-        elif col == "Morning Actual Time In":
-            key_func = lambda x: x["morning_actual_time_in"]
-        elif col == "Supposed Time In":
-            key_func = lambda x: x["supposed_time_in"]
-        elif col == "Afternoon Actual Time Out":
-            key_func = lambda x: x["afternoon_actual_time_out"]
-        elif col == "Supposed Time Out":
-            key_func = lambda x: x["supposed_time_out"]
-        else:
-            key_func = lambda x: x["date"]  # fallback
+        key_func = HISTORY_SORT_KEYS.get(col, itemgetter("date"))  # fallback
 
         self.current_records.sort(key=key_func, reverse=reverse)
         self.populate_history(self.current_records)
@@ -2058,198 +2510,163 @@ class DailyTimeRecordApp:
     # ADDED: More recommended features in the help tabs
     # ------------------------------------------------------------------------
     def show_help_dialog(self):
+        # Reuse the dialog if it was built before and only hidden
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self.reshow_dialog(self._help_window, self._help_texts)
+            return
+
         help_window = tk.Toplevel(self.master)
         help_window.title("How to Use - Daily Time Record")
 
         help_window.transient(self.master)
         help_window.lift()
 
-        help_window.grab_set()
         help_window.geometry("700x550")
-        self.center_child_window(help_window)
 
         notebook = ttk.Notebook(help_window)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # -----------------
-        #  Tab: OVERVIEW
-        # -----------------
-        tab_overview = ttk.Frame(notebook)
-        notebook.add(tab_overview, text="Overview")
-
-        overview_content = """Daily Time Record (DTR) Application - Overview
-
-This version includes:
-- Half-Day checking
-- Flexi Time Out logic
-- Multi-selection for deletion
-- Single-record editing
-- Column sorting on click
-- Press 'Delete' key to remove selected row(s)
-- Press 'Ctrl + A' to select all records
-- Time Picker dialogs
-- Light/Dark theme toggle
-- Fullscreen toggle
-- Keyboard shortcuts for changing the selected date:
-   * Ctrl + Right Arrow  => Next Day
-   * Ctrl + Left Arrow   => Previous Day
-   * Ctrl + Shift + Right Arrow => Next Month
-   * Ctrl + Shift + Left Arrow  => Previous Month
-   * Ctrl + Shift + Alt + Right Arrow => Next Year
-   * Ctrl + Shift + Alt + Left Arrow  => Previous Year
-"""
-        label_overview = tk.Text(tab_overview, wrap="word", font=("Helvetica", 12),
-                                 bg=help_window.cget("bg"), borderwidth=0)
-        label_overview.insert("1.0", overview_content)
-        label_overview.config(state="disabled")
-        label_overview.pack(fill="both", expand=True, padx=10, pady=10)
-
-        # --------------------------
-        #  Tab: STEP-BY-STEP GUIDE
-        # --------------------------
-        tab_guide = ttk.Frame(notebook)
-        notebook.add(tab_guide, text="Step-by-Step Guide")
-
-        guide_content = """Step-by-Step Guide
-
-1. Select the Date (top-left) or use keyboard shortcuts (Ctrl/Shift/Alt + Arrow) to navigate quickly.
-2. Check 'Morning' if you worked in the morning; uncheck if absent.
-3. Check 'Afternoon' if you worked in the afternoon; uncheck if absent.
-4. Enter Actual Time In / Out or click 'Select Time'.
-5. Click 'Calculate Deductions' to see Late/Undertime/Total points.
-6. Click 'Save Record' to store it (multiple records per date allowed if you confirm).
-7. Click 'Export History' => CSV to export all saved data.
-8. In the History section:
-   - The default view shows only the currently selected date's records.
-   - Use the date range filter to see multiple dates, then press 'Search'.
-   - 'Reset' reverts back to showing only the currently selected date's records.
-   - You can multi-select rows with Ctrl+Click or Shift+Click,
-     then press 'Delete' key or right-click => 'Delete Record'.
-   - Right-click => 'Edit Record' modifies times and automatically recalculates
-   - Press 'Ctrl + A' to select all records.
-   - Click column headers to toggle ascending/descending sort.
-   - Single/Double-click the time fields to highlight them for quick editing.
-"""
-        label_guide = tk.Text(tab_guide, wrap="word", font=("Helvetica", 12),
-                              bg=help_window.cget("bg"), borderwidth=0)
-        label_guide.insert("1.0", guide_content)
-        label_guide.config(state="disabled")
-        label_guide.pack(fill="both", expand=True, padx=10, pady=10)
-
-        # -------------------
-        #  Tab: FAQs
-        # -------------------
-        tab_faqs = ttk.Frame(notebook)
-        notebook.add(tab_faqs, text="FAQs")
-
-        faqs_content = """Frequently Asked Questions (FAQs)
-
-Q: Why does the Deduction History only show the selected date by default?
-A: This design helps focus on the current day's data. You can still use date range filters to see more dates.
-
-Q: How do I quickly jump to next/previous days, months, or years?
-A: Use the keyboard shortcuts:
-   * Ctrl + Right/Left => Next/Previous Day
-   * Ctrl + Shift + Right/Left => Next/Previous Month
-   * Ctrl + Shift + Alt + Right/Left => Next/Previous Year
-
-Q: How do I reset the search?
-A: Click the 'Reset' button. This will revert the table to showing only the currently selected date's records.
-
-Q: What if I forget to check Morning or Afternoon?
-A: The system assumes half-day absence for any unchecked portion, adding 0.5 to the deduction.
-
-Q: Can I add multiple records for the same date?
-A: Yes, you'll be prompted with a confirmation if a record already exists for that date.
-
-Q: How do I edit or delete a record?
-A: Right-click on a record in the Deduction History or select it and press 'Delete'. You can also choose 'Edit Record' to modify times.
-
-Q: How does sorting work?
-A: Click the column header to sort ascending/descending for that column. Repeat click to toggle the order.
-
-Q: Does the application remember my data after closing?
-A: Yes, data is stored in JSON (dtr_records.json). Keep it safe to avoid losing records.
-
-Q: Can I see all records at once?
-A: Enter a broad date range in the search fields (e.g., 1900 to 2125) and click 'Search' to see all.
+        self._help_window = help_window
+        self._help_texts = []
+        # Tab frames start empty; each is filled the first time it is shown.
+        # Guide and FAQs are taller than the window, so they use scrollable
+        # Text widgets while the short Overview uses a Label.
+        self._pending_help_tabs = {}
+        for title, content, scrollable in (
+            ("Overview", HELP_OVERVIEW_TEXT, False),
+            ("Step-by-Step Guide", HELP_GUIDE_TEXT, True),
+            ("FAQs", HELP_FAQS_TEXT, True),
+        ):
+            tab = ttk.Frame(notebook)
+            notebook.add(tab, text=title)
+            self._pending_help_tabs[str(tab)] = (tab, content, scrollable)
+
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self.populate_help_tab(notebook))
+        self.populate_help_tab(notebook)
+
+        # Center once the content is packed so the size is final
+        self.center_child_window(help_window)
+        # Grab after the window is shown so the grab doesn't block mapping
+        help_window.after(0, help_window.grab_set)
+        help_window.protocol("WM_DELETE_WINDOW", lambda: self.hide_dialog(help_window))
 
-Q: What if I want to revert to seeing only the selected date after searching?
-A: Simply click 'Reset' or change the date manually (which also forces single-date mode again).
-"""
-        label_faqs = tk.Text(tab_faqs, wrap="word", font=("Helvetica", 12),
-                             bg=help_window.cget("bg"), borderwidth=0)
-        label_faqs.insert("1.0", faqs_content)
-        label_faqs.config(state="disabled")
-        label_faqs.pack(fill="both", expand=True, padx=10, pady=10)
-
-        # Adjust text color based on theme
-        if self.current_theme != 'flatly':  # dark theme
-            label_overview.config(fg="white")
-            label_guide.config(fg="white")
-            label_faqs.config(fg="white")
+    def populate_help_tab(self, notebook):
+        """
+        Build the content of the selected help tab if it hasn't been built yet.
+        """
+        pending = self._pending_help_tabs.pop(notebook.select(), None)
+        if pending is None:
+            return
+        tab, content, scrollable = pending
+
+        if scrollable:
+            text_widget = tk.Text(tab, wrap="word", font=("Helvetica", 12),
+                                  bg=self._themed_bg, borderwidth=0)
+            text_widget.insert("1.0", content)
+            text_widget.config(state="disabled")
+            text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+            self._help_texts.append(text_widget)
+            self.apply_dialog_text_colors([text_widget])
         else:
-            label_overview.config(fg="black")
-            label_guide.config(fg="black")
-            label_faqs.config(fg="black")
+            label = ttk.Label(tab, text=content, style="Help.TLabel",
+                              wraplength=640, justify="left", anchor="nw")
+            label.pack(fill="both", expand=True, padx=10, pady=10)
 
     def show_about_dialog(self):
+        if self._about_window is not None and self._about_window.winfo_exists():
+            self.reshow_dialog(self._about_window)
+            return
+
         about_window = tk.Toplevel(self.master)
         about_window.title("About - Daily Time Record")
 
         about_window.transient(self.master)
         about_window.lift()
 
-        about_window.grab_set()
         about_window.geometry("500x400")
-        self.center_child_window(about_window)
 
         frame = ttk.Frame(about_window, padding=20)
         frame.pack(fill="both", expand=True)
 
-        about_content = """Daily Time Record (DTR) Application
+        label_about = ttk.Label(frame, text=ABOUT_TEXT, style="Help.TLabel",
+                                wraplength=440, justify="left", anchor="nw")
+        label_about.pack(fill="both", expand=True)
 
-Enhanced with:
- - Half-Day Checking
- - Flexi Time Out
- - Multi-selection & Sorting
- - Simplified Record Editing
- - Time Picker for convenience
- - Light/Dark Mode toggle
- - Fullscreen toggle
- - Keyboard Shortcuts for Date Navigation
+        self.center_child_window(about_window)
+        about_window.after(0, about_window.grab_set)
 
-Developer: KCprsnlcc
-GitHub: https://github.com/KCprsnlcc
+        self._about_window = about_window
+        about_window.protocol("WM_DELETE_WINDOW", lambda: self.hide_dialog(about_window))
 
-Disclaimer: Use at your own risk. Keep data backups.
-"""
-        label_about = tk.Text(frame, wrap="word", font=("Helvetica", 12),
-                              bg=about_window.cget("bg"), borderwidth=0)
-        label_about.insert("1.0", about_content)
-        label_about.config(state="disabled")
-        label_about.pack(fill="both", expand=True)
+    def apply_dialog_text_colors(self, text_widgets):
+        """
+        Adjust help/about text colors based on the current theme.
+        """
+        text_color = self._text_fg
+        for widget in text_widgets:
+            widget.config(fg=text_color, bg=self._themed_bg)
 
-        if self.current_theme != 'flatly':
-            label_about.config(fg="white")
-        else:
-            label_about.config(fg="black")
+    def hide_dialog(self, window):
+        """
+        Hide a reusable dialog instead of destroying it.
+        """
+        window.grab_release()
+        window.withdraw()
+
+    def reshow_dialog(self, window, text_widgets=()):
+        """
+        Bring back a dialog hidden by hide_dialog, refreshing its Text widget
+        colors in case the theme changed while it was hidden.
+        """
+        self.apply_dialog_text_colors(text_widgets)
+        window.deiconify()
+        self.center_child_window(window)
+        window.lift()
+        window.focus_set()
+        window.after(0, window.grab_set)
+
+    def on_master_configure(self, event):
+        # Invalidate the cached main window geometry when it moves or resizes
+        if event.widget is self.master:
+            self._master_geometry = None
+
+    def get_master_geometry(self):
+        """
+        Return (x, y, width, height) of the main window, cached until the
+        next <Configure> event on it.
+        """
+        if self._master_geometry is None:
+            self._master_geometry = (
+                self.master.winfo_rootx(),
+                self.master.winfo_rooty(),
+                self.master.winfo_width(),
+                self.master.winfo_height()
+            )
+        return self._master_geometry
 
     def center_child_window(self, child):
-        self.master.update_idletasks()
-        parent_x = self.master.winfo_rootx()
-        parent_y = self.master.winfo_rooty()
-        parent_width = self.master.winfo_width()
-        parent_height = self.master.winfo_height()
+        """
+        Center a child window over the main window once Tk is idle, letting
+        Tk do its pending layout pass instead of forcing update_idletasks.
+        """
+        child.after_idle(lambda: self._center_child_now(child))
+
+    def _center_child_now(self, child):
+        if not child.winfo_exists():
+            return
+        parent_x, parent_y, parent_width, parent_height = self.get_master_geometry()
 
-        child.update_idletasks()
+        # Not yet mapped windows report a 1x1 size; use the requested size then
         child_width = child.winfo_width()
         child_height = child.winfo_height()
+        if child_width <= 1 or child_height <= 1:
+            child_width = child.winfo_reqwidth()
+            child_height = child.winfo_reqheight()
 
         pos_x = parent_x + (parent_width // 2) - (child_width // 2)
         pos_y = parent_y + (parent_height // 2) - (child_height // 2)
 
-        child.geometry(f"+{pos_x}+{pos_y}")
+        child.wm_geometry("+%d+%d" % (pos_x, pos_y))
 
 
 # --------------------------------------------------------------
@@ -2259,10 +2676,14 @@ class EditRecordDialog:
     """
     Dialog to edit the 'morning_actual_time_in' and 'afternoon_actual_time_out' fields only.
     """
-    def __init__(self, parent, record_data, callback_on_save):
+    def __init__(self, parent, record_data, callback_on_save, app=None):
         self.parent = parent
+        # DailyTimeRecordApp whose cached main-window geometry centers us over its master
+        self.app = app
         self.record_data = record_data
         self.callback_on_save = callback_on_save
+        # TimePickerDialog for this dialog's "Pick Time" buttons, built on first use
+        self._time_picker = None
 
         self.top = tk.Toplevel(parent)
         self.top.title("Edit Record")
@@ -2316,13 +2737,16 @@ class EditRecordDialog:
         widget.after(1, lambda: widget.select_range(0, 'end'))
 
     def center_dialog(self):
-        self.parent.update_idletasks()
-        parent_x = self.parent.winfo_rootx()
-        parent_y = self.parent.winfo_rooty()
-        parent_width = self.parent.winfo_width()
-        parent_height = self.parent.winfo_height()
-
+        # One idle pass lays out both windows; update_idletasks is app-wide
         self.top.update_idletasks()
+        if self.app is not None and self.parent is self.app.master:
+            parent_x, parent_y, parent_width, parent_height = self.app.get_master_geometry()
+        else:
+            parent_x = self.parent.winfo_rootx()
+            parent_y = self.parent.winfo_rooty()
+            parent_width = self.parent.winfo_width()
+            parent_height = self.parent.winfo_height()
+
         dialog_width = self.top.winfo_width()
         dialog_height = self.top.winfo_height()
 
@@ -2336,12 +2760,11 @@ class EditRecordDialog:
         time_obj = None
         if current_val != "--:-- --":
             try:
-                time_obj = datetime.strptime(current_val, "%I:%M %p").time()
+                time_obj = parse_time_12h(current_val)
             except:
                 pass
 
-        picker = TimePickerDialog(self.top, initial_time=time_obj, title="Select Time")
-        selected_time = picker.show()
+        selected_time = open_time_picker_dialog(self, self.top, time_obj, "Select Time")
         if selected_time:
             hour_12 = selected_time.hour % 12
             hour_12 = 12 if hour_12 == 0 else hour_12
@@ -2360,12 +2783,17 @@ class EditRecordDialog:
 
 
 def main():
-    setup_logging()
+    log_listener = setup_logging()
     logging.info("Application started.")
     root = tk.Tk()
     app = DailyTimeRecordApp(root)
     root.mainloop()
+    app.flush_pending_saves()
+    # The main loop is gone, so report failed final saves on stderr instead
+    for message in app.take_save_errors():
+        print(message, file=sys.stderr)
     logging.info("Application closed.")
+    log_listener.stop()
 
 
 if __name__ == "__main__":